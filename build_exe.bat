@@ -4,9 +4,11 @@ echo Building Activity Tracker Executable
 echo ==========================================
 echo.
 
-echo Creating icon...
-.venv\Scripts\python.exe create_icon.py
-echo.
+if not exist "icon.ico" (
+    echo icon.ico not found, generating it...
+    .venv\Scripts\python.exe -m create_icon
+    echo.
+)
 
 echo Building executable with PyInstaller...
 echo This may take a few minutes...
@@ -1,49 +1,62 @@
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image
+import numpy as np
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-def create_icon():
-    """Create a modern icon matching the widget's dark theme design"""
+def create_icon(force=False):
+    """Create a modern icon matching the widget's dark theme design
+    
+    Generation is skipped when icon.ico and icon.png are already newer than
+    this script, unless force is True.
+    """
+    src_mtime = os.path.getmtime(__file__)
+    if not force and all(os.path.exists(path) and os.path.getmtime(path) >= src_mtime
+                         for path in ('icon.ico', 'icon.png')):
+        print("Icon is up to date: icon.ico")
+        return
     
     # Create image with transparency
+    # Every shape is rasterized with NumPy masks into one RGBA buffer over a
+    # shared coordinate grid; PIL is only used to encode the result
     size = 256
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    pixels = np.zeros((size, size, 4), np.uint8)
     
     center = size // 2
+    yy, xx = np.ogrid[:size, :size]
+    r = np.hypot(xx - center, yy - center)
     
     # Draw main circular background with gradient effect (dark slate like widget)
     # Outer circle - darker slate
-    draw.ellipse([5, 5, size-5, size-5], fill=(15, 23, 42, 255))
+    pixels[r <= (size - 10) / 2 + 0.5] = (15, 23, 42, 255)
     
     # Inner circle - lighter slate (gradient effect)
     inner_margin = 15
-    draw.ellipse([inner_margin, inner_margin, size-inner_margin, size-inner_margin], 
-                 fill=(30, 41, 59, 255))
+    pixels[r <= (size - 2 * inner_margin) / 2 + 0.5] = (30, 41, 59, 255)
     
     # Draw three colored arcs representing the three timers (like the gradient cards)
-    import math
-    
-    # Green arc (Work time) - top right
+    # Each arc is a ring fading out towards the center. The rings are
+    # rasterized in one vectorized pass over polar coordinates instead of
+    # 25 concentric draw.arc calls per color.
     arc_width = 25
-    for i in range(arc_width):
-        alpha = int(255 * (1 - i/arc_width))
-        draw.arc([40+i, 40+i, size-40-i, size-40-i], 
-                start=-60, end=60, 
-                fill=(16, 185, 129, alpha), width=3)
-    
-    # Orange arc (Leisure time) - bottom right  
-    for i in range(arc_width):
-        alpha = int(255 * (1 - i/arc_width))
-        draw.arc([40+i, 40+i, size-40-i, size-40-i], 
-                start=60, end=180, 
-                fill=(245, 158, 11, alpha), width=3)
-    
-    # Blue arc (Total time) - left side
-    for i in range(arc_width):
-        alpha = int(255 * (1 - i/arc_width))
-        draw.arc([40+i, 40+i, size-40-i, size-40-i], 
-                start=180, end=300, 
-                fill=(59, 130, 246, alpha), width=3)
+    arc_outer = (size - 80) / 2
+    arc_stroke = 3
+    
+    # Angles clockwise from 3 o'clock (PIL convention), mapped to [-60, 300)
+    theta = (np.degrees(np.arctan2(yy - center, xx - center)) + 60) % 360 - 60
+    
+    # Step index of the innermost concentric arc covering each pixel
+    step = np.clip(np.floor(arc_outer - r), 0, arc_width - 1)
+    alpha = (255 * (1 - step / arc_width)).astype(np.uint8)
+    ring = (r <= arc_outer) & (r > arc_outer - arc_width - arc_stroke + 1)
+    
+    for color, start, end in [
+        ((16, 185, 129), -60, 60),     # Green arc (Work time) - top right
+        ((245, 158, 11), 60, 180),     # Orange arc (Leisure time) - bottom right
+        ((59, 130, 246), 180, 300),    # Blue arc (Total time) - left side
+    ]:
+        mask = ring & (theta >= start) & (theta < end)
+        pixels[mask, :3] = color
+        pixels[mask, 3] = alpha[mask]
     
     # Draw central play/activity symbol (modern triangle)
     triangle_size = 50
@@ -56,38 +69,56 @@ def create_icon():
         (triangle_x - triangle_size//3, triangle_y + triangle_size//2),
         (triangle_x + triangle_size//2, triangle_y)
     ]
-    draw.polygon(points, fill=(255, 255, 255, 255))
+    # Inside when the pixel is on the same side of all three edges
+    edges = [(x1 - x0) * (yy - y0) - (y1 - y0) * (xx - x0)
+             for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1])]
+    triangle = ((edges[0] >= 0) & (edges[1] >= 0) & (edges[2] >= 0)) | \
+               ((edges[0] <= 0) & (edges[1] <= 0) & (edges[2] <= 0))
     
     # Add small accent circles for modern look
     accent_radius = 8
     # Top accent (green)
-    draw.ellipse([center - accent_radius, 45 - accent_radius, 
-                  center + accent_radius, 45 + accent_radius],
-                 fill=(16, 185, 129, 255))
-    
+    x_green, y_green = center, 45
     # Bottom right accent (orange)
-    angle_orange = math.radians(120)
-    x_orange = center + 70 * math.cos(angle_orange)
-    y_orange = center + 70 * math.sin(angle_orange)
-    draw.ellipse([x_orange - accent_radius, y_orange - accent_radius,
-                  x_orange + accent_radius, y_orange + accent_radius],
-                 fill=(245, 158, 11, 255))
-    
+    # Placed at 120 degrees: cos = -0.5, sin = sqrt(3)/2
+    x_orange = center + 70 * -0.5
+    y_orange = center + 70 * 0.8660254037844387
     # Bottom left accent (blue)
-    angle_blue = math.radians(240)
-    x_blue = center + 70 * math.cos(angle_blue)
-    y_blue = center + 70 * math.sin(angle_blue)
-    draw.ellipse([x_blue - accent_radius, y_blue - accent_radius,
-                  x_blue + accent_radius, y_blue + accent_radius],
-                 fill=(59, 130, 246, 255))
+    # Placed at 240 degrees: cos = -0.5, sin = -sqrt(3)/2
+    x_blue = center + 70 * -0.5
+    y_blue = center + 70 * -0.8660254037844387
+    
+    def accent(cx, cy):
+        return (xx - cx) ** 2 + (yy - cy) ** 2 <= (accent_radius + 0.5) ** 2
+    
+    # The shapes are opaque, so they are written straight into the buffer
+    for mask, color in [
+        (triangle, (255, 255, 255, 255)),
+        (accent(x_green, y_green), (16, 185, 129, 255)),
+        (accent(x_orange, y_orange), (245, 158, 11, 255)),
+        (accent(x_blue, y_blue), (59, 130, 246, 255)),
+    ]:
+        pixels[mask] = color
+    
+    img = Image.fromarray(pixels, 'RGBA')
     
     # Save as ICO file (Windows icon)
-    img.save('icon.ico', format='ICO', sizes=[(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)])
+    # The smaller sizes are resampled in parallel (PIL releases the GIL while
+    # resizing) and handed to the ICO encoder pre-sized
+    sizes = [(128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
+    with ThreadPoolExecutor() as executor:
+        resized = list(executor.map(lambda dims: img.resize(dims, Image.LANCZOS), sizes))
+    img.save('icon.ico', format='ICO', sizes=[(size, size)] + sizes, append_images=resized)
     print("Modern icon created: icon.ico")
     
-    # Also save as PNG for reference
-    img.save('icon.png', format='PNG')
+    # Also save as PNG for reference (a preview, so favor fast encoding)
+    img.save('icon.png', format='PNG', compress_level=1, optimize=False)
     print("Icon preview created: icon.png")
 
 if __name__ == "__main__":
-    create_icon()
+    # The app ships the pre-built icon.ico; run `python -m create_icon --force`
+    # to regenerate it after changing the design
+    import argparse
+    parser = argparse.ArgumentParser(description="Generate icon.ico and icon.png")
+    parser.add_argument("--force", action="store_true", help="regenerate even if the icon is up to date")
+    create_icon(force=parser.parse_args().force)
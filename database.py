@@ -1,193 +1,513 @@
+import atexit
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, date, timedelta
 from typing import List, Tuple, Optional
 
+# Formats an INTEGER YYYYMMDD date_key back into 'YYYY-MM-DD'
+_DATE_KEY_TEXT = "printf('%04d-%02d-%02d', date_key / 10000, date_key / 100 % 100, date_key % 100)"
+
+# Hot-path statements, kept as constants so the connection's statement
+# cache is hit on every call
+_SQL_UPDATE_SESSION = '''
+    UPDATE activity_sessions
+    SET end_ts = ?, duration_seconds = ?
+    WHERE id = ?
+'''
+
+_SQL_START_SESSION = '''
+    INSERT INTO activity_sessions (date_key, start_ts, is_work, is_active)
+    VALUES (?, ?, ?, 1)
+'''
+
+_SQL_END_SESSION = '''
+    UPDATE activity_sessions
+    SET is_active = 0
+    WHERE id = ?
+'''
+
+# Final duration and end in one row update
+_SQL_CLOSE_SESSION = '''
+    UPDATE activity_sessions
+    SET end_ts = ?, duration_seconds = ?, is_active = 0
+    WHERE id = ?
+'''
+
+_SQL_TODAY_STATS = '''
+    SELECT
+        COALESCE(SUM(total_work_seconds), 0) as work_time,
+        COALESCE(SUM(total_idle_seconds), 0) as idle_time
+    FROM daily_summary
+    WHERE date = ?
+'''
+
+_SQL_TODAY_SESSION_COUNTS = '''
+    SELECT
+        COALESCE(SUM(is_work = 1), 0) as work_sessions,
+        COALESCE(SUM(is_work = 0), 0) as leisure_sessions
+    FROM activity_sessions
+    WHERE date_key = ?
+'''
+
+def date_key(day: date) -> int:
+    """Return the INTEGER YYYYMMDD key used to index sessions by day"""
+    return day.year * 10000 + day.month * 100 + day.day
+
+def day_cutoff(today: date, days: int) -> str:
+    """Return the local "YYYY-MM-DD" date that starts a window of the last N days
+    
+    Shared by the session and pause queries so their windows cover the same
+    days (SQLite's date('now') would be UTC).
+    """
+    return (today - timedelta(days=days)).strftime("%Y-%m-%d")
+
 class ActivityDatabase:
+    # Minimum seconds between two flushes of buffered session updates
+    FLUSH_INTERVAL = 5
+    
     def __init__(self, db_path: str = "activity_tracker.db"):
         self.db_path = db_path
+        
+        # One shared connection for the whole app (autocommit mode).
+        # The Qt timer and the tracker callbacks both use it, so every
+        # access goes through the lock.
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None,
+                                     cached_statements=256)
+        # page_size only applies to a fresh database and must be set before
+        # switching to WAL
+        self._conn.execute("PRAGMA page_size=8192")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=134217728")  # 128 MB
+        self._conn.execute("PRAGMA cache_size=-20000")    # ~20 MB
+        
+        # Buffered session updates: session_id -> (end_ts, duration_seconds)
+        self._pending = {}
+        self._last_flush = time.monotonic()
+        
+        # (day, days, rows) of days before `day` from the last
+        # get_dashboard_stats query; today's row is served from _today_totals
+        self._stats_cache = None
+        # (day, days, rows) from the last get_daily_pause_totals query;
+        # dropped by log_pause
+        self._pause_totals_cache = None
+        
+        # In-memory view of today's totals, kept current by update_session
+        # so the UI can poll get_today_stats without touching SQLite.
+        # _sessions: session_id -> [date_key, is_work, duration_seconds]
+        self._sessions = {}
+        self._finalized = set()  # Ids ended by finalize_session
+        self._today_key = None
+        self._today_totals = None  # [work_seconds, leisure_seconds]
+        # (date_key, (work_sessions, leisure_sessions)); counts only change
+        # when a session is added
+        self._today_counts = None
+        
         self.init_database()
+        atexit.register(self.close)
+    
+    def close(self):
+        """Flush pending updates and close the shared database connection"""
+        with self._lock:
+            if self._conn is None:
+                return
+            self.flush(force=True)
+            # Refresh query planner statistics where SQLite deems it useful
+            self._conn.execute("PRAGMA optimize")
+            self._conn.close()
+            self._conn = None
+    
+    @contextmanager
+    def transaction(self):
+        """Run a block of statements inside a single BEGIN IMMEDIATE/COMMIT
+        
+        Nested blocks join the outermost transaction, so callers can group
+        several session writes (e.g. end one session and start the next)
+        into one commit.
+        """
+        with self._lock:
+            if self._conn.in_transaction:
+                yield self._conn
+                return
+            
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+    
+    def flush(self, force: bool = False):
+        """Write buffered session updates to disk
+        
+        Updates are written at most once every FLUSH_INTERVAL seconds
+        unless force is True. All pending rows go in one transaction.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            if not force and time.monotonic() - self._last_flush < self.FLUSH_INTERVAL:
+                return
+            
+            with self.transaction() as conn:
+                self._write_pending(conn)
+    
+    def _write_pending(self, conn):
+        """Write all buffered session updates; the caller owns the transaction"""
+        rows = [(end_ts, duration, session_id)
+                for session_id, (end_ts, duration) in self._pending.items()]
+        conn.executemany(_SQL_UPDATE_SESSION, rows)
+        
+        self._pending.clear()
+        self._last_flush = time.monotonic()
     
     def init_database(self):
         """Initialize database with required tables"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Table for activity sessions
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS activity_sessions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL,
-                start_time TEXT NOT NULL,
-                end_time TEXT,
-                duration_seconds INTEGER DEFAULT 0,
-                is_work INTEGER DEFAULT 1,
-                is_active INTEGER DEFAULT 1
-            )
-        ''')
-        
-        # Table for daily summaries
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS daily_summary (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT UNIQUE NOT NULL,
-                total_work_seconds INTEGER DEFAULT 0,
-                total_idle_seconds INTEGER DEFAULT 0,
-                total_seconds INTEGER DEFAULT 0
-            )
-        ''')
-        
-        # Table for pause/break periods
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS pause_periods (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                date TEXT NOT NULL,
-                pause_start TEXT NOT NULL,
-                pause_end TEXT,
-                duration_seconds INTEGER NOT NULL
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
+            
+            # Table for activity sessions (day as YYYYMMDD, times as unix epoch)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS activity_sessions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    date_key INTEGER NOT NULL,
+                    start_ts INTEGER NOT NULL,
+                    end_ts INTEGER,
+                    duration_seconds INTEGER DEFAULT 0,
+                    is_work INTEGER DEFAULT 1,
+                    is_active INTEGER DEFAULT 1
+                )
+            ''')
+            
+            cursor.execute("PRAGMA table_info(activity_sessions)")
+            if 'date_key' not in [column[1] for column in cursor.fetchall()]:
+                self._migrate_sessions_to_epoch()
+            
+            # Table for daily summaries
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS daily_summary (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    date TEXT UNIQUE NOT NULL,
+                    total_work_seconds INTEGER DEFAULT 0,
+                    total_idle_seconds INTEGER DEFAULT 0,
+                    total_seconds INTEGER DEFAULT 0
+                )
+            ''')
+            
+            # Table for pause/break periods
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS pause_periods (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    date TEXT NOT NULL,
+                    pause_start TEXT NOT NULL,
+                    pause_end TEXT,
+                    duration_seconds INTEGER NOT NULL
+                )
+            ''')
+            
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_sessions_date
+                ON activity_sessions(date_key, is_work)
+            ''')
+            
+            # (date, pause_start) also serves the history's newest-first
+            # paging, so the old date-only index is dropped
+            cursor.execute("DROP INDEX IF EXISTS idx_pauses_date")
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_pauses_date_start
+                ON pause_periods(date, pause_start)
+            ''')
+            
+            # (Re)create the summary triggers when missing or in the older
+            # INSERT OR IGNORE + UPDATE form
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_session_ins'")
+            row = cursor.fetchone()
+            if row is None or 'ON CONFLICT' not in row[0]:
+                self._create_summary_triggers()
+            
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'daily_pause_summary'")
+            if cursor.fetchone() is None:
+                self._create_pause_summary()
     
-    def start_session(self, is_work: bool = True) -> int:
-        """Start a new activity session"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def _create_summary_triggers(self):
+        """Keep daily_summary in step with activity_sessions and backfill it"""
+        day = "printf('%04d-%02d-%02d', NEW.date_key / 10000, NEW.date_key / 100 % 100, NEW.date_key % 100)"
         
-        now = datetime.now()
-        date_str = now.strftime("%Y-%m-%d")
-        time_str = now.strftime("%H:%M:%S")
+        with self.transaction() as conn:
+            conn.execute("DROP TRIGGER IF EXISTS trg_session_ins")
+            conn.execute("DROP TRIGGER IF EXISTS trg_session_upd")
+            
+            # One upsert per new session: create the day's row or add to it
+            conn.execute(f'''
+                CREATE TRIGGER trg_session_ins AFTER INSERT ON activity_sessions
+                BEGIN
+                    INSERT INTO daily_summary (date, total_work_seconds, total_idle_seconds, total_seconds)
+                    VALUES ({day},
+                            NEW.duration_seconds * (NEW.is_work = 1),
+                            NEW.duration_seconds * (NEW.is_work = 0),
+                            NEW.duration_seconds)
+                    ON CONFLICT(date) DO UPDATE
+                    SET total_work_seconds = total_work_seconds + excluded.total_work_seconds,
+                        total_idle_seconds = total_idle_seconds + excluded.total_idle_seconds,
+                        total_seconds = total_seconds + excluded.total_seconds;
+                END
+            ''')
+            # Moves the old contribution out and the new one in, so it also
+            # covers a session switching between work and leisure
+            conn.execute(f'''
+                CREATE TRIGGER trg_session_upd AFTER UPDATE OF duration_seconds, is_work ON activity_sessions
+                BEGIN
+                    UPDATE daily_summary
+                    SET total_work_seconds = total_work_seconds
+                            + NEW.duration_seconds * (NEW.is_work = 1) - OLD.duration_seconds * (OLD.is_work = 1),
+                        total_idle_seconds = total_idle_seconds
+                            + NEW.duration_seconds * (NEW.is_work = 0) - OLD.duration_seconds * (OLD.is_work = 0),
+                        total_seconds = total_seconds + NEW.duration_seconds - OLD.duration_seconds
+                    WHERE date = {day};
+                END
+            ''')
+            
+            conn.execute("DELETE FROM daily_summary")
+            conn.execute(f'''
+                INSERT INTO daily_summary (date, total_work_seconds, total_idle_seconds, total_seconds)
+                SELECT
+                    {_DATE_KEY_TEXT},
+                    SUM(CASE WHEN is_work = 1 THEN duration_seconds ELSE 0 END),
+                    SUM(CASE WHEN is_work = 0 THEN duration_seconds ELSE 0 END),
+                    SUM(duration_seconds)
+                FROM activity_sessions
+                GROUP BY date_key
+            ''')
+    
+    def _create_pause_summary(self):
+        """Create daily_pause_summary, the trigger that maintains it, and backfill it
         
-        cursor.execute('''
-            INSERT INTO activity_sessions (date, start_time, is_work, is_active)
-            VALUES (?, ?, ?, 1)
-        ''', (date_str, time_str, 1 if is_work else 0))
+        Pauses are only ever inserted, so one upsert per new pause keeps the
+        per-day count and total current without aggregating pause_periods.
+        """
+        with self.transaction() as conn:
+            conn.execute('''
+                CREATE TABLE daily_pause_summary (
+                    date TEXT PRIMARY KEY,
+                    pause_count INTEGER NOT NULL DEFAULT 0,
+                    pause_seconds INTEGER NOT NULL DEFAULT 0
+                ) WITHOUT ROWID
+            ''')
+            conn.execute('''
+                CREATE TRIGGER trg_pause_ins AFTER INSERT ON pause_periods
+                BEGIN
+                    INSERT INTO daily_pause_summary (date, pause_count, pause_seconds)
+                    VALUES (NEW.date, 1, NEW.duration_seconds)
+                    ON CONFLICT(date) DO UPDATE
+                    SET pause_count = pause_count + 1,
+                        pause_seconds = pause_seconds + excluded.pause_seconds;
+                END
+            ''')
+            conn.execute('''
+                INSERT INTO daily_pause_summary (date, pause_count, pause_seconds)
+                SELECT date, COUNT(*), SUM(duration_seconds)
+                FROM pause_periods
+                GROUP BY date
+            ''')
+    
+    def _migrate_sessions_to_epoch(self):
+        """Convert a pre-epoch activity_sessions table (TEXT date/start_time/end_time)"""
+        with self.transaction() as conn:
+            conn.execute("ALTER TABLE activity_sessions RENAME TO activity_sessions_old")
+            conn.execute('''
+                CREATE TABLE activity_sessions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    date_key INTEGER NOT NULL,
+                    start_ts INTEGER NOT NULL,
+                    end_ts INTEGER,
+                    duration_seconds INTEGER DEFAULT 0,
+                    is_work INTEGER DEFAULT 1,
+                    is_active INTEGER DEFAULT 1
+                )
+            ''')
+            # Times were stored as local wall clock; sessions whose end time
+            # is before their start time ran past midnight
+            conn.execute('''
+                INSERT INTO activity_sessions
+                    (id, date_key, start_ts, end_ts, duration_seconds, is_work, is_active)
+                SELECT
+                    id,
+                    CAST(replace(date, '-', '') AS INTEGER),
+                    CAST(strftime('%s', date || ' ' || start_time, 'utc') AS INTEGER),
+                    CAST(strftime('%s', date || ' ' || end_time, 'utc') AS INTEGER)
+                        + CASE WHEN end_time < start_time THEN 86400 ELSE 0 END,
+                    duration_seconds,
+                    is_work,
+                    is_active
+                FROM activity_sessions_old
+            ''')
+            conn.execute("DROP TABLE activity_sessions_old")
+    
+    def start_session(self, is_work: bool = True) -> int:
+        """Start a new activity session"""
+        now = time.time()
         
-        session_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute(_SQL_START_SESSION, (date_key(date.fromtimestamp(now)), int(now), 1 if is_work else 0))
+            
+            session_id = cursor.lastrowid
+            self._sessions[session_id] = [date_key(date.fromtimestamp(now)), bool(is_work), 0]
+            self._today_counts = None
         
         return session_id
     
-    def update_session(self, session_id: int, duration_seconds: int, is_work: bool):
-        """Update session duration"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        now = datetime.now()
-        time_str = now.strftime("%H:%M:%S")
-        
-        cursor.execute('''
-            UPDATE activity_sessions 
-            SET end_time = ?, duration_seconds = ?, is_work = ?
-            WHERE id = ?
-        ''', (time_str, duration_seconds, 1 if is_work else 0, session_id))
+    def update_session(self, session_id: int, duration_seconds: int):
+        """Update session duration (buffered, see flush)
         
-        conn.commit()
-        conn.close()
+        Ignored for a session that has already been finalized, so a late
+        auto-save from the background writer cannot roll back its final
+        duration.
+        """
+        with self._lock:
+            if session_id in self._finalized:
+                return
+            self._buffer_update(session_id, duration_seconds)
+            self.flush()
+    
+    def _buffer_update(self, session_id: int, duration_seconds: int):
+        """Queue a duration update and apply it to today's in-memory totals"""
+        self._pending[session_id] = (int(time.time()), duration_seconds)
+        
+        session = self._sessions.get(session_id)
+        if session is None:
+            self._today_totals = None
+            self._stats_cache = None
+        else:
+            day, is_work, previous = session
+            session[2] = duration_seconds
+            if self._today_totals is not None and day == self._today_key:
+                self._today_totals[0 if is_work else 1] += duration_seconds - previous
+            else:
+                # The write lands on an earlier day (e.g. across midnight)
+                self._stats_cache = None
     
     def end_session(self, session_id: int):
         """End an activity session"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE activity_sessions 
-            SET is_active = 0
-            WHERE id = ?
-        ''', (session_id,))
-        
-        conn.commit()
-        conn.close()
+        self.finalize_session(session_id)
+    
+    def finalize_session(self, session_id: int, duration_seconds: Optional[int] = None):
+        """Write a session's final duration (if given) and end it in one row update"""
+        with self._lock:
+            if duration_seconds is not None:
+                self._buffer_update(session_id, duration_seconds)
+            
+            final = self._pending.pop(session_id, None)
+            with self.transaction() as conn:
+                self._write_pending(conn)
+                if final is None:
+                    conn.execute(_SQL_END_SESSION, (session_id,))
+                else:
+                    conn.execute(_SQL_CLOSE_SESSION, (*final, session_id))
+            
+            self._sessions.pop(session_id, None)
+            self._finalized.add(session_id)
     
     def get_today_stats(self) -> Tuple[int, int]:
-        """Return today's work and leisure seconds"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        today = date.today().strftime("%Y-%m-%d")
+        """Return today's work and leisure seconds
         
-        cursor.execute('''
-            SELECT 
-                SUM(CASE WHEN is_work = 1 THEN duration_seconds ELSE 0 END) as work_time,
-                SUM(CASE WHEN is_work = 0 THEN duration_seconds ELSE 0 END) as idle_time
-            FROM activity_sessions
-            WHERE date = ?
-        ''', (today,))
-        
-        result = cursor.fetchone()
-        conn.close()
-        
-        work_time = result[0] if result[0] else 0
-        idle_time = result[1] if result[1] else 0
-        
-        return work_time, idle_time
+        Served from memory; the database is only queried on the first call,
+        after the day changes, or after a change update_session can't track.
+        """
+        today = date.today()
+        
+        with self._lock:
+            if self._today_totals is None or self._today_key != date_key(today):
+                self.flush(force=True)
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_TODAY_STATS, (today.strftime("%Y-%m-%d"),))
+                
+                self._today_totals = list(cursor.fetchone())
+                self._today_key = date_key(today)
+            
+            return tuple(self._today_totals)
     
     def get_today_session_counts(self) -> Tuple[int, int]:
-        """Return today's work and leisure session counts"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        today = date.today().strftime("%Y-%m-%d")
-        
-        cursor.execute('''
-            SELECT 
-                SUM(CASE WHEN is_work = 1 THEN 1 ELSE 0 END) as work_sessions,
-                SUM(CASE WHEN is_work = 0 THEN 1 ELSE 0 END) as leisure_sessions
-            FROM activity_sessions
-            WHERE date = ?
-        ''', (today,))
-        
-        result = cursor.fetchone()
-        conn.close()
+        """Return today's work and leisure session counts (cached until a
+        session is added or the day changes)"""
+        today = date_key(date.today())
+        
+        with self._lock:
+            if self._today_counts is None or self._today_counts[0] != today:
+                cursor = self._conn.cursor()
+                cursor.execute(_SQL_TODAY_SESSION_COUNTS, (today,))
+                self._today_counts = (today, cursor.fetchone())
+            
+            return self._today_counts[1]
+    
+    def get_dashboard_stats(self, days: int = 7,
+                            live_session: Optional[Tuple[int, int]] = None) -> List[Tuple[str, int, int]]:
+        """Return (date, work_seconds, leisure_seconds) per day for the last N days
         
-        work_sessions = result[0] if result[0] else 0
-        leisure_sessions = result[1] if result[1] else 0
+        Past days come from daily_summary, which triggers keep up to date,
+        and only change when a write lands on an earlier day, so they are
+        cached for the widest window fetched until the day changes. Today's
+        row comes from the live in-memory totals (see get_today_stats).
         
-        return work_sessions, leisure_sessions
+        live_session is an optional (session_id, seconds) for the running
+        session; its time beyond the last saved duration is added to today.
+        """
+        today = date.today()
+        today_str = today.strftime("%Y-%m-%d")
+        cutoff_str = day_cutoff(today, days)
+        
+        with self._lock:
+            cache = self._stats_cache
+            if cache is None or cache[0] != today or cache[1] < days:
+                self.flush(force=True)
+                cursor = self._conn.cursor()
+                cursor.execute('''
+                    SELECT date, total_work_seconds, total_idle_seconds
+                    FROM daily_summary
+                    WHERE date >= ? AND date < ?
+                    ORDER BY date DESC
+                ''', (cutoff_str, today_str))
+                
+                cache = (today, days, cursor.fetchall())
+                self._stats_cache = cache
+            
+            work_time, idle_time = self.get_today_stats()
+            
+            session = self._sessions.get(live_session[0]) if live_session else None
+            if session is not None and session[0] == date_key(today):
+                unsaved = max(0, live_session[1] - session[2])
+                if session[1]:
+                    work_time += unsaved
+                else:
+                    idle_time += unsaved
+        
+        rows = [row for row in cache[2] if row[0] >= cutoff_str]
+        if work_time or idle_time:
+            rows.insert(0, (today_str, work_time, idle_time))
+        return rows
     
-    def get_daily_stats(self, days: int = 7) -> List[Tuple[str, int, int]]:
-        """Return statistics for the last N days"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT 
-                date,
-                SUM(CASE WHEN is_work = 1 THEN duration_seconds ELSE 0 END) as work_time,
-                SUM(CASE WHEN is_work = 0 THEN duration_seconds ELSE 0 END) as idle_time
-            FROM activity_sessions
-            WHERE date >= date('now', '-' || ? || ' days')
-            GROUP BY date
-            ORDER BY date DESC
-        ''', (days,))
-        
-        results = cursor.fetchall()
-        conn.close()
-        
-        return results
+    def get_daily_stats(self, days: int = 7,
+                        live_session: Optional[Tuple[int, int]] = None) -> List[Tuple[str, int, int]]:
+        """Return statistics for the last N days (see get_dashboard_stats)"""
+        return self.get_dashboard_stats(days, live_session)
     
     def get_weekly_stats(self, weeks: int = 4) -> List[Tuple[str, int, int]]:
         """Return weekly statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT 
-                strftime('%Y-W%W', date) as week,
-                SUM(CASE WHEN is_work = 1 THEN duration_seconds ELSE 0 END) as work_time,
-                SUM(CASE WHEN is_work = 0 THEN duration_seconds ELSE 0 END) as idle_time
-            FROM activity_sessions
-            WHERE date >= date('now', '-' || ? || ' days')
-            GROUP BY week
-            ORDER BY week DESC
-        ''', (weeks * 7,))
-        
-        results = cursor.fetchall()
-        conn.close()
-        
-        return results
+        weekly = {}
+        for date_str, work_time, idle_time in self.get_dashboard_stats(weeks * 7):
+            week = datetime.strptime(date_str, "%Y-%m-%d").strftime("%Y-W%W")
+            totals = weekly.setdefault(week, [0, 0])
+            totals[0] += work_time
+            totals[1] += idle_time
+        
+        return [(week, work_time, idle_time)
+                for week, (work_time, idle_time) in sorted(weekly.items(), reverse=True)]
     
     def log_pause(self, duration_seconds: int, pause_start_timestamp: float = None):
         """Log a pause/break period
@@ -195,9 +515,6 @@ class ActivityDatabase:
             duration_seconds: Duration of the pause in seconds
             pause_start_timestamp: Unix timestamp when pause started (if None, calculated from now-duration)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         now = datetime.now()
         
         # Use actual start timestamp if provided, otherwise calculate
@@ -219,97 +536,112 @@ class ActivityDatabase:
         
         print(f"[DATABASE] Logging pause: date={date_str}, start={pause_start}, end={pause_end}, duration={duration_seconds}s")
         
-        cursor.execute('''
-            INSERT INTO pause_periods (date, pause_start, pause_end, duration_seconds)
-            VALUES (?, ?, ?, ?)
-        ''', (date_str, pause_start, pause_end, int(duration_seconds)))
+        with self._lock:
+            self._conn.execute('''
+                INSERT INTO pause_periods (date, pause_start, pause_end, duration_seconds)
+                VALUES (?, ?, ?, ?)
+            ''', (date_str, pause_start, pause_end, int(duration_seconds)))
+            self._pause_totals_cache = None
         
-        conn.commit()
-        conn.close()
-        print(f"[DATABASE] Pause logged successfully")    
+        print(f"[DATABASE] Pause logged successfully")
     def get_pause_periods(self, days: int = 7) -> List[Tuple[str, str, int]]:
         """Get pause periods for the last N days"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT date, pause_start, duration_seconds
-            FROM pause_periods
-            WHERE date >= date('now', '-' || ? || ' days')
-            ORDER BY date DESC, pause_start DESC
-        ''', (days,))
-        
-        results = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute('''
+                SELECT date, pause_start, duration_seconds
+                FROM pause_periods
+                WHERE date >= ?
+                ORDER BY date DESC, pause_start DESC
+            ''', (day_cutoff(date.today(), days),))
+            
+            results = cursor.fetchall()
         
         return results
     
+    def get_daily_pause_totals(self, days: int = 7) -> List[Tuple[str, int, int]]:
+        """Return (date, pause_count, pause_seconds) per day for the last N days
+        
+        Cached until a pause is logged or the day changes.
+        """
+        today = date.today()
+        
+        with self._lock:
+            cache = self._pause_totals_cache
+            if cache is None or cache[0] != today or cache[1] != days:
+                cursor = self._conn.cursor()
+                cursor.execute('''
+                    SELECT date, pause_count, pause_seconds
+                    FROM daily_pause_summary
+                    WHERE date >= ?
+                    ORDER BY date
+                ''', (day_cutoff(today, days),))
+                
+                cache = (today, days, cursor.fetchall())
+                self._pause_totals_cache = cache
+            
+            return cache[2]
+    
     def get_today_pause_stats(self) -> Tuple[int, int]:
         """Get today's pause statistics (total_seconds, count)"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         today = datetime.now().strftime("%Y-%m-%d")
         
-        cursor.execute('''
-            SELECT 
-                COALESCE(SUM(duration_seconds), 0) as total_seconds,
-                COUNT(*) as count
-            FROM pause_periods
-            WHERE date = ?
-        ''', (today,))
-        
-        result = cursor.fetchone()
-        conn.close()
-        
-        return (result[0], result[1]) if result else (0, 0)
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute('''
+                SELECT pause_seconds, pause_count
+                FROM daily_pause_summary
+                WHERE date = ?
+            ''', (today,))
+            
+            return cursor.fetchone() or (0, 0)
     
     def get_all_sessions(self, days: int = 365) -> List[Tuple[str, str, str, int, str]]:
         """Get all individual sessions with start/end times
         Returns: (date, start_time, end_time, duration_seconds, session_type)
         session_type: 'Work' or 'Leisure'
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT 
-                date,
-                start_time,
-                COALESCE(end_time, 'In Progress') as end_time,
-                duration_seconds,
-                CASE WHEN is_work = 1 THEN 'Work' ELSE 'Leisure' END as session_type
-            FROM activity_sessions
-            WHERE date >= date('now', '-' || ? || ' days')
-            ORDER BY date DESC, start_time DESC
-        ''', (days,))
-        
-        results = cursor.fetchall()
-        conn.close()
+        cutoff = date_key(date.today() - timedelta(days=days))
+        
+        with self._lock:
+            self.flush(force=True)
+            cursor = self._conn.cursor()
+            cursor.execute(f'''
+                SELECT
+                    {_DATE_KEY_TEXT} as date,
+                    strftime('%H:%M:%S', start_ts, 'unixepoch', 'localtime') as start_time,
+                    COALESCE(strftime('%H:%M:%S', end_ts, 'unixepoch', 'localtime'), 'In Progress') as end_time,
+                    duration_seconds,
+                    CASE WHEN is_work = 1 THEN 'Work' ELSE 'Leisure' END as session_type
+                FROM activity_sessions
+                WHERE date_key >= ?
+                ORDER BY date_key DESC, start_ts DESC
+            ''', (cutoff,))
+            
+            results = cursor.fetchall()
         
         return results
     
-    def get_all_pauses_detailed(self, days: int = 365) -> List[Tuple[str, str, str, int]]:
-        """Get all pause periods with start/end times
+    def get_all_pauses_detailed(self, days: int = 365, offset: int = 0,
+                                limit: int = -1) -> List[Tuple[str, str, str, int]]:
+        """Get pause periods with start/end times, newest first
         Returns: (date, pause_start, pause_end, duration_seconds)
+        offset/limit select one page of the result (limit -1: all rows)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT 
-                date,
-                pause_start,
-                COALESCE(pause_end, 'Unknown') as pause_end,
-                duration_seconds
-            FROM pause_periods
-            WHERE date >= date('now', '-' || ? || ' days')
-            ORDER BY date DESC, pause_start DESC
-        ''', (days,))
-        
-        results = cursor.fetchall()
-        conn.close()
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute('''
+                SELECT
+                    date,
+                    pause_start,
+                    COALESCE(pause_end, 'Unknown') as pause_end,
+                    duration_seconds
+                FROM pause_periods
+                WHERE date >= ?
+                ORDER BY date DESC, pause_start DESC
+                LIMIT ? OFFSET ?
+            ''', (day_cutoff(date.today(), days), limit, offset))
+            
+            results = cursor.fetchall()
         
         return results
-
-
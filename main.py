@@ -1,28 +1,555 @@
 import sys
 import os
+import re
+import time
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QPushButton, QCheckBox, 
-                             QTabWidget, QTableWidget, QTableWidgetItem, 
-                             QSystemTrayIcon, QMenu, QAction, QGraphicsDropShadowEffect,
-                             QStackedWidget, QMessageBox, QSlider, QSpinBox, QScrollArea)
-from PyQt5.QtCore import QTimer, Qt, QTime, QPoint, QPropertyAnimation, QEasingCurve, pyqtSignal, QObject
-from PyQt5.QtGui import QFont, QColor, QPalette, QIcon, QPixmap, QPainter, QLinearGradient
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
-import numpy as np
-from datetime import datetime, timedelta
+                             QTabWidget, QTableView, QHeaderView,
+                             QSystemTrayIcon, QMenu, QAction,
+                             QStackedWidget, QButtonGroup, QMessageBox, QSpinBox, QScrollArea)
+from PyQt5.QtCore import (QTimer, Qt, pyqtSignal, QObject,
+                          QAbstractTableModel, QModelIndex, QElapsedTimer, QThread, pyqtSlot, QEvent, QRectF)
+from PyQt5.QtGui import QFont, QColor, QPalette, QIcon, QPixmap, QPainter, QLinearGradient, QPainterPath
+from datetime import datetime
+from functools import lru_cache
 from database import ActivityDatabase
 from tracker import ActivityTracker
 
+# Matplotlib and NumPy are heavy to import and only the charts need them,
+# so they are loaded on first use of a chart
+Figure = None
+FigureCanvas = None
+Patch = None
+np = None
+
+
+def _load_matplotlib():
+    """Import the matplotlib classes and NumPy used by the charts (once)"""
+    global Figure, FigureCanvas, Patch, np
+    if Figure is None:
+        import numpy
+        np = numpy
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+        from matplotlib.figure import Figure as _Figure
+        from matplotlib.patches import Patch as _Patch
+        FigureCanvas = FigureCanvasQTAgg
+        Patch = _Patch
+        Figure = _Figure
+
+# idle_threshold line of app_settings.txt
+_SETTINGS_RE = re.compile(r"^idle_threshold=\s*(\d+)", re.MULTILINE)
+
+# Dark background shared by the application palette and the chart faces
+_DARK_BG = "#1e293b"
+
+# Stylesheets and static text, built once at import time
+_MODERN_STYLESHEET = """
+QMainWindow {
+    background: transparent;
+}
+
+QWidget#centralWidget {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #1e293b, stop:1 #0f172a);
+    border-radius: 15px;
+}
+
+QWidget#titleBar {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #1e293b, stop:1 #334155);
+    border-top-left-radius: 15px;
+    border-top-right-radius: 15px;
+    border-bottom: 2px solid rgba(59, 130, 246, 0.3);
+}
+
+QLabel#titleLabel {
+    color: white;
+}
+
+QPushButton#minButton {
+    background: rgba(255, 255, 255, 0.08);
+    color: white;
+    border: none;
+    border-radius: 8px;
+}
+
+QPushButton#minButton:hover {
+    background: rgba(59, 130, 246, 0.4);
+}
+
+QPushButton#maxButton {
+    background: rgba(255, 255, 255, 0.08);
+    color: white;
+    border: none;
+    border-radius: 8px;
+}
+
+QPushButton#maxButton:hover {
+    background: rgba(59, 130, 246, 0.4);
+}
+
+QPushButton#closeButton {
+    background: rgba(255, 255, 255, 0.08);
+    color: white;
+    border: none;
+    border-radius: 8px;
+}
+
+QPushButton#closeButton:hover {
+    background: rgba(239, 68, 68, 0.6);
+}
+
+QWidget#contentWidget {
+    background: transparent;
+}
+
+QLabel#statusLabel, QLabel#statusLabelIdle {
+    color: rgba(255, 255, 255, 0.7);
+    padding: 10px;
+    background: rgba(255, 255, 255, 0.05);
+    border-radius: 10px;
+}
+
+QLabel#statusLabelActive {
+    color: white;
+    padding: 10px;
+    background: rgba(16, 185, 129, 0.2);
+    border-radius: 10px;
+}
+
+QCheckBox#leisureCheckbox {
+    color: white;
+    padding: 12px;
+    background: rgba(245, 158, 11, 0.15);
+    border-radius: 10px;
+}
+
+QCheckBox#leisureCheckbox::indicator {
+    width: 20px;
+    height: 20px;
+    border-radius: 5px;
+    border: 2px solid rgba(245, 158, 11, 0.5);
+    background: rgba(255, 255, 255, 0.1);
+}
+
+QCheckBox#leisureCheckbox::indicator:checked {
+    background: #f59e0b;
+    border-color: #f59e0b;
+}
+
+QWidget#buttonBar {
+    background: transparent;
+}
+
+QPushButton#navButton {
+    background: rgba(255, 255, 255, 0.05);
+    color: rgba(255, 255, 255, 0.7);
+    border: 2px solid rgba(255, 255, 255, 0.1);
+    border-radius: 12px;
+    padding: 14px 15px;
+    font-weight: bold;
+    font-size: 11px;
+    max-width: 95px;
+}
+
+QPushButton#navButton:hover {
+    background: rgba(255, 255, 255, 0.1);
+    border-color: rgba(59, 130, 246, 0.3);
+}
+
+QPushButton#navButton:checked {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 rgba(59, 130, 246, 0.4), stop:1 rgba(99, 102, 241, 0.4));
+    color: white;
+    border-color: rgba(59, 130, 246, 0.6);
+}
+
+QStackedWidget#stackedWidget {
+    background: rgba(255, 255, 255, 0.03);
+    border-radius: 15px;
+    padding: 5px;
+}
+
+QWidget#tabContent {
+    background: transparent;
+}
+
+QLabel#sectionTitle {
+    color: #ffffff;
+    background: transparent;
+}
+
+QTableView#modernTable {
+    background: rgba(15, 23, 42, 0.6);
+    border: 1px solid rgba(59, 130, 246, 0.2);
+    border-radius: 10px;
+    color: #e2e8f0;
+    gridline-color: rgba(255, 255, 255, 0.1);
+    font-size: 11px;
+    alternate-background-color: rgba(30, 41, 59, 0.5);
+}
+
+QTableView#modernTable::item {
+    padding: 10px;
+    border: none;
+    color: #e2e8f0;
+}
+
+QTableView#modernTable::item:alternate {
+    background: rgba(30, 41, 59, 0.5);
+}
+
+QTableView#modernTable::item:selected {
+    background: rgba(59, 130, 246, 0.4);
+    color: white;
+}
+
+QHeaderView::section {
+    background: rgba(30, 41, 59, 0.9);
+    color: #ffffff;
+    padding: 12px;
+    border: none;
+    font-weight: bold;
+    font-size: 11px;
+}
+
+QPushButton#infoButton {
+    background: rgba(59, 130, 246, 0.3);
+    color: white;
+    border: 2px solid rgba(59, 130, 246, 0.5);
+    border-radius: 8px;
+    padding: 8px 16px;
+    font-weight: bold;
+    font-size: 11px;
+}
+
+QPushButton#infoButton:hover {
+    background: rgba(59, 130, 246, 0.5);
+    border-color: rgba(59, 130, 246, 0.8);
+}
+
+QPushButton#modernButton {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #3b82f6, stop:1 #2563eb);
+    color: white;
+    border: none;
+    border-radius: 10px;
+    padding: 12px;
+    font-weight: bold;
+    font-size: 11px;
+}
+
+QPushButton#modernButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #2563eb, stop:1 #1d4ed8);
+}
+
+QPushButton#modernButton:pressed {
+    background: #1e40af;
+}
+
+QPushButton#dangerButton {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 rgba(239, 68, 68, 0.6), stop:1 rgba(220, 38, 38, 0.6));
+    color: white;
+    border: 2px solid rgba(239, 68, 68, 0.5);
+    border-radius: 10px;
+    padding: 12px;
+    font-weight: bold;
+    font-size: 11px;
+}
+
+QPushButton#dangerButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #ef4444, stop:1 #dc2626);
+    border-color: #ef4444;
+}
+
+QPushButton#dangerButton:pressed {
+    background: #991b1b;
+}
+
+QScrollBar:vertical {
+    background: transparent;
+    width: 0px;
+    border-radius: 0px;
+}
+
+QScrollBar::handle:vertical {
+    background: transparent;
+    border-radius: 0px;
+}
+
+QScrollBar::handle:vertical:hover {
+    background: transparent;
+}
+"""
+
+_INFO_MSG_STYLESHEET = """
+QMessageBox {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #1e293b, stop:1 #0f172a);
+    border-radius: 15px;
+}
+QMessageBox QLabel {
+    color: white;
+    min-width: 450px;
+    background: transparent;
+}
+QMessageBox QWidget {
+    background: transparent;
+}
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #3b82f6, stop:1 #2563eb);
+    color: white;
+    border: none;
+    border-radius: 8px;
+    padding: 10px 25px;
+    font-weight: bold;
+    min-width: 100px;
+    font-size: 11px;
+}
+QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #2563eb, stop:1 #1d4ed8);
+}
+"""
+
+_ANALYTICS_STYLESHEET = """
+QMainWindow { background: #0f172a; }
+QWidget { background: #0f172a; color: white; }
+QTabWidget::pane { border: 1px solid #3b82f6; }
+QTabBar::tab { background: #1e293b; color: white; padding: 8px 20px; }
+QTabBar::tab:selected { background: #1e293b; border-bottom: 3px solid #3b82f6; }
+QPushButton#refreshButton { background: #3b82f6; color: white; padding: 10px; border-radius: 5px; font-weight: bold; }
+"""
+
+_INFO_HTML = """
+<h3 style='color: #3b82f6;'>⏱️ How Activity Tracking Works</h3>
+
+<p><b style='color: #10b981;'>Automatic Timer Start:</b><br>
+• The timer starts automatically when you move your mouse or press any key<br>
+• It detects your activity in real-time</p>
+
+<p><b style='color: #f59e0b;'>Automatic Timer Stop:</b><br>
+• The timer stops automatically after <b>60 seconds of inactivity</b><br>
+• Inactivity = no mouse movement, clicks, or keyboard input</p>
+
+<p><b style='color: #3b82f6;'>Work Mode vs Leisure Mode:</b><br>
+• <b>Work Mode (default):</b> Time is counted as productive work<br>
+• <b>Leisure Mode:</b> Check the box to track break/leisure time<br>
+• Switch modes anytime - times are kept separate</p>
+
+<p><b style='color: #8b5cf6;'>Data Persistence:</b><br>
+• Your activity is automatically saved every 60 seconds<br>
+• Data is stored in a local database<br>
+• View your history and charts anytime</p>
+"""
+
+# Overview chart bar width (slightly narrower for many bars)
+_BAR_WIDTH = 0.26
+
+
+@lru_cache(maxsize=8)
+def _bar_positions(num_days, width):
+    """Return the (center, left, right) x arrays for num_days bar groups"""
+    x = np.arange(num_days)
+    return x, x - width, x + width
+
+
+def _weekly_totals(dates, *series):
+    """Sum daily hour arrays into 7-day calendar spans, the last one ending on the newest day
+    
+    dates are "YYYY-MM-DD" strings, oldest first, and may skip days without
+    data; those count as zero. Returns the span labels ("MM-DD–MM-DD",
+    clipped to the first date) followed by the summed arrays.
+    """
+    days = np.array([datetime.strptime(d, "%Y-%m-%d").toordinal() for d in dates])
+    first, last = days[0], days[-1]
+    num_groups = (last - first) // 7 + 1
+    groups = num_groups - 1 - (last - days) // 7  # Oldest span first
+    labels = []
+    for g in range(num_groups):
+        end = last - 7 * (num_groups - 1 - g)
+        start = max(end - 6, first)
+        labels.append(f"{datetime.fromordinal(start):%m-%d}–{datetime.fromordinal(end):%m-%d}")
+    return (labels,) + tuple(np.bincount(groups, weights=hours, minlength=num_groups)
+                             for hours in series)
+
+
+# Tray icon, resolved on first use and shared afterwards
+_TRAY_ICON = None
+
+
+def _get_tray_icon():
+    """Return the tray QIcon: the application icon, or a painted fallback"""
+    global _TRAY_ICON
+    if _TRAY_ICON is None and not QApplication.windowIcon().isNull():
+        # Reuse icon.ico as already loaded by main()
+        _TRAY_ICON = QApplication.windowIcon()
+    if _TRAY_ICON is None:
+        # Create a simple icon
+        pixmap = QPixmap(32, 32)
+        pixmap.fill(QColor(59, 130, 246))  # Blue
+        painter = QPainter(pixmap)
+        painter.setPen(QColor(255, 255, 255))
+        painter.setFont(QFont("Arial", 16, QFont.Bold))
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, "⏱")
+        painter.end()
+        _TRAY_ICON = QIcon(pixmap)
+    return _TRAY_ICON
+
+
+class DatabaseWriter(QObject):
+    """Runs fire-and-forget database writes on a background QThread
+    
+    Signals emitted from the GUI thread are queued to this object's thread,
+    so the periodic auto-save commit never blocks the UI.
+    """
+    update_session_requested = pyqtSignal(int, int)
+    stop_requested = pyqtSignal()
+    
+    def __init__(self, db):
+        super().__init__()
+        self.db = db
+        self.update_session_requested.connect(self.update_session)
+        self.stop_requested.connect(self.stop)
+    
+    @pyqtSlot(int, int)
+    def update_session(self, session_id, duration_seconds):
+        self.db.update_session(session_id, duration_seconds)
+    
+    @pyqtSlot()
+    def stop(self):
+        """Quit the thread once the writes queued before this call are done"""
+        QThread.currentThread().quit()
+
+
+class RowsTableModel(QAbstractTableModel):
+    """Read-only table model over a list of row tuples, formatted on demand"""
+    def __init__(self, headers, formatters=None, colors=None, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._formatters = formatters or {}  # column -> callable(value) -> str
+        self._colors = colors or {}          # column -> callable(value) -> QColor
+        self._rows = []
+        self._fetch_page = None   # callable(offset, limit) -> rows, while paging
+        self._page_size = 0
+    
+    def set_rows(self, rows):
+        """Replace all rows with a single model reset"""
+        self.beginResetModel()
+        self._rows = rows
+        self._fetch_page = None
+        self.endResetModel()
+    
+    def set_pager(self, fetch_page, page_size=200):
+        """Replace all rows with the first page; the view fetches more as it scrolls"""
+        self.beginResetModel()
+        self._rows = list(fetch_page(0, page_size))
+        self._fetch_page = fetch_page if len(self._rows) == page_size else None
+        self._page_size = page_size
+        self.endResetModel()
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetch_page is not None
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        rows = self._fetch_page(len(self._rows), self._page_size)
+        if len(rows) < self._page_size:
+            self._fetch_page = None
+        if rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            value = self._rows[index.row()][index.column()]
+            formatter = self._formatters.get(index.column())
+            return formatter(value) if formatter else value
+        if role == Qt.ForegroundRole:
+            color = self._colors.get(index.column())
+            return color(self._rows[index.row()][index.column()]) if color else None
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+
+class GradientCard(QWidget):
+    """Rounded gradient card whose background is rendered once per size
+    
+    Paints what the card stylesheet used to (diagonal gradient, 12px
+    corners, translucent 4px bottom edge) from a cached pixmap, so the
+    per-second label updates repaint with a pixmap copy instead of
+    re-evaluating a stylesheet gradient.
+    """
+    RADIUS = 12
+    EDGE = 4
+    
+    def __init__(self, color1, color2, parent=None):
+        super().__init__(parent)
+        self._gradient = QLinearGradient(0, 0, 1, 1)
+        self._gradient.setCoordinateMode(QLinearGradient.ObjectBoundingMode)
+        self._gradient.setColorAt(0, QColor(color1))
+        self._gradient.setColorAt(1, QColor(color2))
+        self._background = None
+    
+    def _render_background(self):
+        """Render the card background at the current size and pixel ratio"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        
+        rect = QRectF(self.rect())
+        outer = QPainterPath()
+        outer.addRoundedRect(rect, self.RADIUS, self.RADIUS)
+        inner = QPainterPath()
+        inner.addRoundedRect(rect.adjusted(0, 0, 0, -self.EDGE), self.RADIUS, self.RADIUS - self.EDGE)
+        
+        # Like the stylesheet border, the edge straddles the background's
+        # bottom: its lower half darkens whatever is behind the card
+        fill = QPainterPath()
+        fill.addRoundedRect(rect.adjusted(0, 0, 0, -self.EDGE / 2), self.RADIUS, self.RADIUS)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillPath(fill, self._gradient)
+        painter.fillPath(outer.subtracted(inner), QColor(0, 0, 0, 64))  # Pseudo-shadow edge
+        painter.end()
+        return pixmap
+    
+    def paintEvent(self, event):
+        if self._background is None or self._background.size() != self.size() * self.devicePixelRatioF():
+            self._background = self._render_background()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background)
+        painter.end()
+
+
 class AnalyticsWindow(QMainWindow):
     """Advanced Analytics Window with multiple chart types"""
     def __init__(self, db):
         super().__init__()
+        _load_matplotlib()
         self.db = db
         self.setWindowTitle("📈 Advanced Analytics")
         self.setGeometry(100, 100, 1400, 900)
-        self.setStyleSheet(self.get_stylesheet())
+        self.setStyleSheet(_ANALYTICS_STYLESHEET)
         
         # Main widget and layout
         main_widget = QWidget()
@@ -32,7 +559,6 @@ class AnalyticsWindow(QMainWindow):
         
         # Create tabs for different chart types
         tabs = QTabWidget()
-        tabs.setStyleSheet("QTabWidget::pane { border: 1px solid #3b82f6; } QTabBar::tab { background: #1e293b; color: white; padding: 8px 20px; }")
         
         # Tab 1: Daily stats (fixed - now shows daily hours, not cumulative)
         tabs.addTab(self.create_cumulative_chart(), "📊 Daily Hours")
@@ -54,17 +580,9 @@ class AnalyticsWindow(QMainWindow):
         # Refresh button
         refresh_btn = QPushButton("🔄 Refresh Analytics")
         refresh_btn.clicked.connect(self.refresh_all)
-        refresh_btn.setStyleSheet("QPushButton { background: #3b82f6; color: white; padding: 10px; border-radius: 5px; font-weight: bold; }")
+        refresh_btn.setObjectName("refreshButton")
         layout.addWidget(refresh_btn)
     
-    def get_stylesheet(self):
-        return """
-        QMainWindow { background: #0f172a; }
-        QWidget { background: #0f172a; color: white; }
-        QTabBar::tab:selected { background: #1e293b; border-bottom: 3px solid #3b82f6; }
-        QTabBar::tab { background: #0f172a; }
-        """
-    
     def create_cumulative_chart(self):
         """Daily work/leisure hours over time (NOT cumulative, shows daily totals)"""
         widget = QWidget()
@@ -80,8 +598,8 @@ class AnalyticsWindow(QMainWindow):
         work_hours = [s[1] / 3600 for s in stats]
         leisure_hours = [s[2] / 3600 for s in stats]
         
-        fig = Figure(figsize=(12, 5), facecolor='#1e293b')
-        ax = fig.add_subplot(111, facecolor='#1e293b')
+        fig = Figure(figsize=(12, 5), facecolor=_DARK_BG)
+        ax = fig.add_subplot(111, facecolor=_DARK_BG)
         
         # Plot daily hours (not cumulative)
         x = range(len(dates))
@@ -126,23 +644,23 @@ class AnalyticsWindow(QMainWindow):
         layout = QHBoxLayout()
         
         stats = self.db.get_daily_stats(30)
-        pauses = self.db.get_pause_periods(days=30)
+        pause_totals = self.db.get_daily_pause_totals(days=30)
         
         total_work = sum(s[1] for s in stats) / 3600
         total_leisure = sum(s[2] for s in stats) / 3600
-        total_pauses = sum(p[2] for p in pauses) / 3600
+        total_pauses = sum(secs for d, count, secs in pause_totals) / 3600
         
-        fig = Figure(figsize=(12, 5), facecolor='#1e293b')
+        fig = Figure(figsize=(12, 5), facecolor=_DARK_BG)
         
         # Work vs Leisure pie
-        ax1 = fig.add_subplot(121, facecolor='#1e293b')
+        ax1 = fig.add_subplot(121, facecolor=_DARK_BG)
         colors1 = ['#10b981', '#f59e0b']
         ax1.pie([total_work, total_leisure], labels=['Work', 'Leisure'], autopct='%1.1f%%',
                 colors=colors1, textprops={'color': 'white', 'fontweight': 'bold'})
         ax1.set_title('Work vs Leisure (30 Days)', color='white', fontsize=12, fontweight='bold')
         
         # All three pie
-        ax2 = fig.add_subplot(122, facecolor='#1e293b')
+        ax2 = fig.add_subplot(122, facecolor=_DARK_BG)
         colors2 = ['#10b981', '#f59e0b', '#8b5cf6']
         ax2.pie([total_work, total_leisure, total_pauses], labels=['Work', 'Leisure', 'Pauses'],
                 autopct='%1.1f%%', colors=colors2, textprops={'color': 'white', 'fontweight': 'bold'})
@@ -160,7 +678,6 @@ class AnalyticsWindow(QMainWindow):
         layout = QVBoxLayout()
         
         stats = self.db.get_daily_stats(30)
-        pauses = self.db.get_pause_periods(days=30)
         
         if not stats:
             layout.addWidget(QLabel("No data available"))
@@ -171,16 +688,13 @@ class AnalyticsWindow(QMainWindow):
         work_hours = [s[1] / 3600 for s in stats]
         leisure_hours = [s[2] / 3600 for s in stats]
         
-        pause_by_date = {}
-        for p in pauses:
-            if p[0] not in pause_by_date:
-                pause_by_date[p[0]] = 0
-            pause_by_date[p[0]] += p[2]
+        # Per-day pause totals are summed by the database
+        pause_by_date = {d: secs for d, count, secs in self.db.get_daily_pause_totals(days=30)}
         
         pause_hours = [pause_by_date.get(d, 0) / 3600 for d in dates]
         
-        fig = Figure(figsize=(12, 5), facecolor='#1e293b')
-        ax = fig.add_subplot(111, facecolor='#1e293b')
+        fig = Figure(figsize=(12, 5), facecolor=_DARK_BG)
+        ax = fig.add_subplot(111, facecolor=_DARK_BG)
         
         x = range(len(dates))
         width = 0.8
@@ -221,16 +735,12 @@ class AnalyticsWindow(QMainWindow):
             return widget
         
         durations = [p[2] / 60 for p in pauses]  # Convert to minutes
-        dates = [p[0] for p in pauses]
-        
-        pause_by_date = {}
-        for d in dates:
-            pause_by_date[d] = pause_by_date.get(d, 0) + 1
+        pause_by_date = {d: count for d, count, secs in self.db.get_daily_pause_totals(days=90)}
         
-        fig = Figure(figsize=(12, 5), facecolor='#1e293b')
+        fig = Figure(figsize=(12, 5), facecolor=_DARK_BG)
         
         # Histogram of pause durations
-        ax1 = fig.add_subplot(121, facecolor='#1e293b')
+        ax1 = fig.add_subplot(121, facecolor=_DARK_BG)
         ax1.hist(durations, bins=15, color='#8b5cf6', alpha=0.7, edgecolor='white')
         ax1.set_title('Pause Duration Distribution', color='white', fontsize=12, fontweight='bold')
         ax1.set_xlabel('Minutes', color='white')
@@ -238,7 +748,7 @@ class AnalyticsWindow(QMainWindow):
         ax1.tick_params(colors='white')
         
         # Pauses per day trend
-        ax2 = fig.add_subplot(122, facecolor='#1e293b')
+        ax2 = fig.add_subplot(122, facecolor=_DARK_BG)
         sorted_dates = sorted(pause_by_date.keys())
         pause_counts = [pause_by_date[d] for d in sorted_dates]
         ax2.plot(sorted_dates, pause_counts, marker='o', color='#8b5cf6', linewidth=2, markersize=5)
@@ -264,7 +774,6 @@ class AnalyticsWindow(QMainWindow):
         layout = QVBoxLayout()
         
         stats = self.db.get_daily_stats(90)
-        pauses = self.db.get_pause_periods(days=90)
         
         if not stats:
             layout.addWidget(QLabel("No data available"))
@@ -289,25 +798,25 @@ class AnalyticsWindow(QMainWindow):
             weekly_work[week_key].append(work_secs / 3600)
             weekly_leisure[week_key].append(leisure_secs / 3600)
         
-        # Group pauses by week
-        for date_str, pause_start, duration in pauses:
+        # Group pauses by week from the per-day totals: [seconds, count]
+        for date_str, count, secs in self.db.get_daily_pause_totals(days=90):
             date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
             week_num = date_obj.isocalendar()[1]
             week_key = f"W{week_num}"
             
-            if week_key not in weekly_pauses:
-                weekly_pauses[week_key] = []
-            
-            weekly_pauses[week_key].append(duration / 3600)
+            totals = weekly_pauses.setdefault(week_key, [0, 0])
+            totals[0] += secs
+            totals[1] += count
         
         # Calculate weekly averages
         weeks = sorted(weekly_work.keys(), key=lambda x: int(x[1:]))
         avg_work = [sum(weekly_work[w]) / len(weekly_work[w]) for w in weeks]
         avg_leisure = [sum(weekly_leisure[w]) / len(weekly_leisure[w]) for w in weeks]
-        avg_pauses = [sum(weekly_pauses.get(w, [0])) / len(weekly_pauses.get(w, [1])) for w in weeks]
+        avg_pauses = [weekly_pauses[w][0] / 3600 / weekly_pauses[w][1] if w in weekly_pauses else 0
+                      for w in weeks]
         
-        fig = Figure(figsize=(12, 5), facecolor='#1e293b')
-        ax = fig.add_subplot(111, facecolor='#1e293b')
+        fig = Figure(figsize=(12, 5), facecolor=_DARK_BG)
+        ax = fig.add_subplot(111, facecolor=_DARK_BG)
         
         x = range(len(weeks))
         width = 0.25
@@ -360,6 +869,12 @@ class ModernStopwatchWidget(QMainWindow):
     # Signal for thread-safe pause detection (duration, pause_start_timestamp, work_end_timestamp)
     pause_detected_signal = pyqtSignal(float, float, float)
     
+    # Minimum seconds between two chart refreshes; calls in between coalesce
+    CHART_MIN_INTERVAL = 0.5
+    
+    # Below this canvas width the overview shows weekly instead of daily bars
+    CHART_WEEKLY_WIDTH = 560
+    
     def __init__(self):
         super().__init__()
         
@@ -375,6 +890,12 @@ class ModernStopwatchWidget(QMainWindow):
         db_path = os.path.join(self.app_dir, "activity_tracker.db")
         self.db = ActivityDatabase(db_path=db_path)
         
+        # Background thread for writes the UI does not wait on
+        self.db_thread = QThread(self)
+        self.db_writer = DatabaseWriter(self.db)
+        self.db_writer.moveToThread(self.db_thread)
+        self.db_thread.start()
+        
         # Load saved settings
         self.idle_threshold = self.load_settings()
         self.tracker = ActivityTracker(idle_threshold=self.idle_threshold)
@@ -383,7 +904,11 @@ class ModernStopwatchWidget(QMainWindow):
         self.pause_detected_signal.connect(self.on_pause_detected_safe)
         
         self.session_id = None
-        self.session_start_time = None
+        # Monotonic clock for the running session (invalid when there is none)
+        self._session_elapsed = QElapsedTimer()
+        # Wall-clock start, only compared with the tracker's wall-clock
+        # work-end time (the monotonic clock stops during system suspend)
+        self._session_start_wall = None
         self.work_seconds = 0
         self.idle_seconds = 0
         self.is_working = True  # True = work, False = leisure
@@ -395,6 +920,24 @@ class ModernStopwatchWidget(QMainWindow):
         # Track current date for midnight rollover
         self.current_date = datetime.now().date()
         
+        # Last text set on each display label and last status state,
+        # so update_display only touches widgets whose content changed
+        self._label_text = {}
+        self._status_active = None
+        
+        # Info and "Settings Saved" dialogs, created the first time they
+        # are opened
+        self._info_msgbox = None
+        self._settings_msgbox = None
+        # Advanced analytics window, open while not None
+        self.analytics_window = None
+        
+        # Chart refresh throttling (see refresh_charts)
+        self._last_chart_refresh = 0.0
+        self._chart_refresh_pending = False
+        # Set when a refresh was skipped because the chart was hidden
+        self._charts_dirty = False
+        
         # For dragging the window
         self.dragging = False
         self.drag_position = None
@@ -414,16 +957,13 @@ class ModernStopwatchWidget(QMainWindow):
     
     def load_settings(self):
         """Load settings from file, or return default"""
+        settings_path = os.path.join(self.app_dir, "app_settings.txt")
         try:
-            settings_path = os.path.join(self.app_dir, "app_settings.txt")
-            if os.path.exists(settings_path):
-                with open(settings_path, "r") as f:
-                    for line in f:
-                        if line.startswith("idle_threshold="):
-                            return int(line.split("=")[1].strip())
-        except:
-            pass
-        return 60  # Default 60 seconds
+            with open(settings_path, "r") as f:
+                match = _SETTINGS_RE.search(f.read())
+        except OSError:
+            match = None
+        return int(match.group(1)) if match else 60  # Default 60 seconds
     def init_ui(self):
         """Initialize the user interface with modern design"""
         self.setWindowTitle("⚡ Activity Tracker")
@@ -432,9 +972,8 @@ class ModernStopwatchWidget(QMainWindow):
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowSystemMenuHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
         
-        # Set window icon for taskbar
-        icon = QIcon("icon.ico")
-        self.setWindowIcon(icon)
+        # Set window icon for taskbar (main() has already loaded icon.ico)
+        self.setWindowIcon(QApplication.windowIcon())
         
         # Window size - now resizable with min/max constraints
         self.setGeometry(100, 100, 700, 700)
@@ -474,36 +1013,19 @@ class ModernStopwatchWidget(QMainWindow):
         button_bar.setLayout(button_layout)
         content_layout.addWidget(button_bar)
         
-        # Navigation buttons
-        self.btn_timer = QPushButton("⏱ Timer")
-        self.btn_timer.setObjectName("navButton")
-        self.btn_timer.setCheckable(True)
-        self.btn_timer.setChecked(True)
-        self.btn_timer.setMaximumWidth(95)
-        self.btn_timer.clicked.connect(lambda: self.switch_page(0))
-        button_layout.addWidget(self.btn_timer)
-        
-        self.btn_history = QPushButton("📊 History")
-        self.btn_history.setObjectName("navButton")
-        self.btn_history.setCheckable(True)
-        self.btn_history.setMaximumWidth(95)
-        self.btn_history.clicked.connect(lambda: self.switch_page(1))
-        button_layout.addWidget(self.btn_history)
-        
-        self.btn_charts = QPushButton("📈 Charts")
-        self.btn_charts.setObjectName("navButton")
-        self.btn_charts.setCheckable(True)
-        self.btn_charts.setMaximumWidth(95)
-        self.btn_charts.clicked.connect(lambda: self.switch_page(2))
-        button_layout.addWidget(self.btn_charts)
-        
-        # Settings button
-        self.btn_settings = QPushButton("⚙️ Settings")
-        self.btn_settings.setObjectName("navButton")
-        self.btn_settings.setCheckable(True)
-        self.btn_settings.setMaximumWidth(95)
-        self.btn_settings.clicked.connect(lambda: self.switch_page(3))
-        button_layout.addWidget(self.btn_settings)
+        # Navigation buttons in one exclusive group: checking one unchecks
+        # the others, and the button id is the page index
+        self.nav_group = QButtonGroup(self)
+        self.nav_group.setExclusive(True)
+        for i, label in enumerate(("⏱ Timer", "📊 History", "📈 Charts", "⚙️ Settings")):
+            btn = QPushButton(label)
+            btn.setObjectName("navButton")
+            btn.setCheckable(True)
+            btn.setMaximumWidth(95)
+            button_layout.addWidget(btn)
+            self.nav_group.addButton(btn, i)
+        self.nav_group.button(0).setChecked(True)
+        self.nav_group.idClicked.connect(self.switch_page)
         
         # Info button (moved from History tab)
         info_btn = QPushButton("ℹ️ Info")
@@ -516,9 +1038,6 @@ class ModernStopwatchWidget(QMainWindow):
         button_layout.insertStretch(0)
         button_layout.addStretch()
         
-        # Store buttons in list for easy access
-        self.nav_buttons = [self.btn_timer, self.btn_history, self.btn_charts, self.btn_settings]
-        
         # Stacked widget to hold pages
         self.stacked_widget = QStackedWidget()
         self.stacked_widget.setObjectName("stackedWidget")
@@ -528,21 +1047,30 @@ class ModernStopwatchWidget(QMainWindow):
         page_timer = self.create_stopwatch_tab()
         self.stacked_widget.addWidget(page_timer)
         
-        page_history = self.create_history_tab()
-        self.stacked_widget.addWidget(page_history)
-        
-        page_charts = self.create_charts_tab()
-        self.stacked_widget.addWidget(page_charts)
-        
-        page_settings = self.create_settings_tab()
-        self.stacked_widget.addWidget(page_settings)
+        # History, charts and settings are built on first visit (see switch_page)
+        self._lazy_pages = {1: self.create_history_tab, 2: self.create_charts_tab,
+                            3: self.create_settings_tab}
+        for _ in self._lazy_pages:
+            self.stacked_widget.addWidget(QWidget())
     
     def switch_page(self, index):
         """Switch between pages"""
-        self.stacked_widget.setCurrentIndex(index)
-        # Update button states
-        for i, btn in enumerate(self.nav_buttons):
-            btn.setChecked(i == index)
+        builder = self._lazy_pages.pop(index, None)
+        if builder is not None:
+            # Replace the placeholder with the real page; the window is
+            # already on screen here, so hold repaints until the swap is done
+            self.stacked_widget.setUpdatesEnabled(False)
+            try:
+                placeholder = self.stacked_widget.widget(index)
+                self.stacked_widget.removeWidget(placeholder)
+                placeholder.deleteLater()
+                self.stacked_widget.insertWidget(index, builder())
+                self.stacked_widget.setCurrentIndex(index)
+            finally:
+                self.stacked_widget.setUpdatesEnabled(True)
+        else:
+            self.stacked_widget.setCurrentIndex(index)
+        self._refresh_dirty_charts()
     
     def create_title_bar(self):
         """Create custom title bar with dark theme"""
@@ -557,9 +1085,11 @@ class ModernStopwatchWidget(QMainWindow):
         
         # App icon
         icon_label = QLabel()
-        icon_pixmap = QPixmap("icon.ico")
+        # Taken from the already-loaded icon (scaled from its 32px frame),
+        # so icon.ico is not decoded a second time
+        icon_pixmap = self.windowIcon().pixmap(24, 24)
         if not icon_pixmap.isNull():
-            icon_label.setPixmap(icon_pixmap.scaled(24, 24, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            icon_label.setPixmap(icon_pixmap)
         else:
             icon_label.setText("⚡")
             icon_label.setFont(QFont("Segoe UI", 14))
@@ -680,28 +1210,14 @@ class ModernStopwatchWidget(QMainWindow):
     
     def create_time_card(self, title, object_name, color1, color2, subtitle=None, extra_padding=False):
         """Create a modern time display card with gradient"""
-        card = QWidget()
+        card = GradientCard(color1, color2)
         card.setObjectName(object_name)
         
-        # Compact design to fit all cards in the window
-        card.setStyleSheet(f"""
-            QWidget#{object_name} {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {color1}, stop:1 {color2});
-                border-radius: 12px;
-                padding: 10px;
-                min-height: 75px;
-                max-height: 90px;
-            }}
-        """)
-        
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setXOffset(0)
-        shadow.setYOffset(5)
-        shadow.setColor(QColor(0, 0, 0, 60))
-        card.setGraphicsEffect(shadow)
+        # Compact design to fit all cards in the window: 75-90px of content
+        # plus 2x10px padding and the 4px bottom edge (which stands in for
+        # a drop shadow)
+        card.setMinimumHeight(99)
+        card.setMaximumHeight(114)
         
         card_layout = QVBoxLayout()
         card_layout.setSpacing(2)
@@ -750,14 +1266,22 @@ class ModernStopwatchWidget(QMainWindow):
         layout.addWidget(activity_title)
         
         # Activity Table with Start/End times
-        self.history_table = QTableWidget()
+        work_color, leisure_color = QColor("#10b981"), QColor("#f59e0b")  # Green, orange
+        self.history_model = RowsTableModel(
+            ["Date", "Start Time", "End Time", "Duration", "Type"],
+            formatters={3: self.format_seconds},
+            colors={4: lambda kind: work_color if kind == "Work" else leisure_color},
+        )
+        self.history_table = QTableView()
         self.history_table.setObjectName("modernTable")
-        self.history_table.setColumnCount(5)
-        self.history_table.setHorizontalHeaderLabels(["Date", "Start Time", "End Time", "Duration", "Type"])
+        self.history_table.setModel(self.history_model)
         self.history_table.horizontalHeader().setStretchLastSection(False)
         self.history_table.verticalHeader().setVisible(False)
         self.history_table.setAlternatingRowColors(True)
-        self.history_table.setRowHeight(0, 30)
+        # Uniform fixed-height rows: the view places rows arithmetically
+        # instead of asking the model for each row's size hint
+        self.history_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.history_table.verticalHeader().setDefaultSectionSize(30)
         # Set column widths
         self.history_table.setColumnWidth(0, 90)   # Date
         self.history_table.setColumnWidth(1, 85)   # Start Time
@@ -766,7 +1290,7 @@ class ModernStopwatchWidget(QMainWindow):
         self.history_table.setColumnWidth(4, 80)   # Type
         self.history_table.setMaximumHeight(300)
         self.history_table.setStyleSheet(self.history_table.styleSheet() + """
-            QTableWidget {
+            QTableView {
                 gridline-color: #404040;
                 background-color: #1e1e1e;
             }
@@ -776,7 +1300,7 @@ class ModernStopwatchWidget(QMainWindow):
                 border: 1px solid #404040;
                 font-weight: bold;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 6px;
                 height: 30px;
             }
@@ -790,14 +1314,21 @@ class ModernStopwatchWidget(QMainWindow):
         layout.addWidget(pauses_title)
         
         # Pauses table with Start/End times
-        self.pauses_table = QTableWidget()
+        pause_color = QColor("#a855f7")  # Purple
+        self.pauses_model = RowsTableModel(
+            ["Date", "Start Time", "End Time", "Duration"],
+            formatters={3: self.format_seconds},
+            colors={3: lambda duration: pause_color},
+        )
+        self.pauses_table = QTableView()
         self.pauses_table.setObjectName("modernTable")
-        self.pauses_table.setColumnCount(4)
-        self.pauses_table.setHorizontalHeaderLabels(["Date", "Start Time", "End Time", "Duration"])
+        self.pauses_table.setModel(self.pauses_model)
         self.pauses_table.horizontalHeader().setStretchLastSection(False)
         self.pauses_table.verticalHeader().setVisible(False)
         self.pauses_table.setAlternatingRowColors(True)
-        self.pauses_table.setRowHeight(0, 30)
+        # Uniform fixed-height rows, as in the sessions table
+        self.pauses_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.pauses_table.verticalHeader().setDefaultSectionSize(30)
         # Set column widths
         self.pauses_table.setColumnWidth(0, 90)   # Date
         self.pauses_table.setColumnWidth(1, 85)   # Start Time
@@ -805,7 +1336,7 @@ class ModernStopwatchWidget(QMainWindow):
         self.pauses_table.setColumnWidth(3, 90)   # Duration
         self.pauses_table.setMaximumHeight(280)
         self.pauses_table.setStyleSheet(self.pauses_table.styleSheet() + """
-            QTableWidget {
+            QTableView {
                 gridline-color: #404040;
                 background-color: #1e1e1e;
             }
@@ -815,7 +1346,7 @@ class ModernStopwatchWidget(QMainWindow):
                 border: 1px solid #404040;
                 font-weight: bold;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 6px;
                 height: 30px;
             }
@@ -887,9 +1418,11 @@ class ModernStopwatchWidget(QMainWindow):
         scroll_content.setLayout(scroll_layout)
         
         # Initialize matplotlib figure with larger size
-        self.figure = Figure(figsize=(8, 8), facecolor='#1e293b')
+        _load_matplotlib()
+        self.figure = Figure(figsize=(8, 8), facecolor=_DARK_BG)
         self.canvas = FigureCanvas(self.figure)
         self.canvas.setMinimumHeight(600)  # Minimum height to see content
+        self.build_chart_scaffold()
         scroll_layout.addWidget(self.canvas)
         
         scroll_area.setWidget(scroll_content)
@@ -999,28 +1532,24 @@ class ModernStopwatchWidget(QMainWindow):
         with open(settings_path, "w") as f:
             f.write(f"idle_threshold={new_timeout}\n")
         
-        QMessageBox.information(
-            self,
-            "Settings Saved",
-            f"Idle timeout set to {new_timeout} seconds.\n\nChanges will take effect immediately.",
-            QMessageBox.Ok
-        )
+        # Reuse the same message box; only its text changes between saves
+        if self._settings_msgbox is None:
+            msg = QMessageBox(self)
+            msg.setWindowTitle("Settings Saved")
+            msg.setIcon(QMessageBox.Information)
+            msg.setStandardButtons(QMessageBox.Ok)
+            self._settings_msgbox = msg
+        
+        self._settings_msgbox.setText(
+            f"Idle timeout set to {new_timeout} seconds.\n\nChanges will take effect immediately.")
+        self._settings_msgbox.exec_()
     
     def init_tray(self):
         """Initialize system tray icon"""
         # Create tray icon
         self.tray_icon = QSystemTrayIcon(self)
         
-        # Create a simple icon
-        pixmap = QPixmap(32, 32)
-        pixmap.fill(QColor(59, 130, 246))  # Blue
-        painter = QPainter(pixmap)
-        painter.setPen(QColor(255, 255, 255))
-        painter.setFont(QFont("Arial", 16, QFont.Bold))
-        painter.drawText(pixmap.rect(), Qt.AlignCenter, "⏱")
-        painter.end()
-        
-        self.tray_icon.setIcon(QIcon(pixmap))
+        self.tray_icon.setIcon(_get_tray_icon())
         
         # Create tray menu
         tray_menu = QMenu()
@@ -1043,6 +1572,18 @@ class ModernStopwatchWidget(QMainWindow):
         self.tray_icon.activated.connect(self.tray_icon_activated)
         self.tray_icon.show()
     
+    def showEvent(self, event):
+        """Bring the displays up to date when the window is shown again"""
+        super().showEvent(event)
+        self.update_display()
+        self._refresh_dirty_charts()
+    
+    def changeEvent(self, event):
+        """Bring the displays up to date when the window is restored"""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange and not self.isMinimized():
+            self.update_display()
+    
     def tray_icon_activated(self, reason):
         """Handle tray icon activation"""
         if reason == QSystemTrayIcon.DoubleClick:
@@ -1067,240 +1608,7 @@ class ModernStopwatchWidget(QMainWindow):
     
     def apply_modern_style(self):
         """Apply modern dark theme stylesheet"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background: transparent;
-            }
-            
-            QWidget#centralWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1e293b, stop:1 #0f172a);
-                border-radius: 15px;
-            }
-            
-            QWidget#titleBar {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #1e293b, stop:1 #334155);
-                border-top-left-radius: 15px;
-                border-top-right-radius: 15px;
-                border-bottom: 2px solid rgba(59, 130, 246, 0.3);
-            }
-            
-            QLabel#titleLabel {
-                color: white;
-            }
-            
-            QPushButton#minButton {
-                background: rgba(255, 255, 255, 0.08);
-                color: white;
-                border: none;
-                border-radius: 8px;
-            }
-            
-            QPushButton#minButton:hover {
-                background: rgba(59, 130, 246, 0.4);
-            }
-            
-            QPushButton#maxButton {
-                background: rgba(255, 255, 255, 0.08);
-                color: white;
-                border: none;
-                border-radius: 8px;
-            }
-            
-            QPushButton#maxButton:hover {
-                background: rgba(59, 130, 246, 0.4);
-            }
-            
-            QPushButton#closeButton {
-                background: rgba(255, 255, 255, 0.08);
-                color: white;
-                border: none;
-                border-radius: 8px;
-            }
-            
-            QPushButton#closeButton:hover {
-                background: rgba(239, 68, 68, 0.6);
-            }
-            
-            QWidget#contentWidget {
-                background: transparent;
-            }
-            
-            QLabel#statusLabel {
-                color: rgba(255, 255, 255, 0.7);
-                padding: 10px;
-                background: rgba(255, 255, 255, 0.05);
-                border-radius: 10px;
-            }
-            
-            QCheckBox#leisureCheckbox {
-                color: white;
-                padding: 12px;
-                background: rgba(245, 158, 11, 0.15);
-                border-radius: 10px;
-            }
-            
-            QCheckBox#leisureCheckbox::indicator {
-                width: 20px;
-                height: 20px;
-                border-radius: 5px;
-                border: 2px solid rgba(245, 158, 11, 0.5);
-                background: rgba(255, 255, 255, 0.1);
-            }
-            
-            QCheckBox#leisureCheckbox::indicator:checked {
-                background: #f59e0b;
-                border-color: #f59e0b;
-            }
-            
-            QWidget#buttonBar {
-                background: transparent;
-            }
-            
-            QPushButton#navButton {
-                background: rgba(255, 255, 255, 0.05);
-                color: rgba(255, 255, 255, 0.7);
-                border: 2px solid rgba(255, 255, 255, 0.1);
-                border-radius: 12px;
-                padding: 14px 15px;
-                font-weight: bold;
-                font-size: 11px;
-                max-width: 95px;
-            }
-            
-            QPushButton#navButton:hover {
-                background: rgba(255, 255, 255, 0.1);
-                border-color: rgba(59, 130, 246, 0.3);
-            }
-            
-            QPushButton#navButton:checked {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(59, 130, 246, 0.4), stop:1 rgba(99, 102, 241, 0.4));
-                color: white;
-                border-color: rgba(59, 130, 246, 0.6);
-            }
-            
-            QStackedWidget#stackedWidget {
-                background: rgba(255, 255, 255, 0.03);
-                border-radius: 15px;
-                padding: 5px;
-            }
-            
-            QWidget#tabContent {
-                background: transparent;
-            }
-            
-            QLabel#sectionTitle {
-                color: #ffffff;
-                background: transparent;
-            }
-            
-            QTableWidget#modernTable {
-                background: rgba(15, 23, 42, 0.6);
-                border: 1px solid rgba(59, 130, 246, 0.2);
-                border-radius: 10px;
-                color: #e2e8f0;
-                gridline-color: rgba(255, 255, 255, 0.1);
-                font-size: 11px;
-                alternate-background-color: rgba(30, 41, 59, 0.5);
-            }
-            
-            QTableWidget#modernTable::item {
-                padding: 10px;
-                border: none;
-                color: #e2e8f0;
-            }
-            
-            QTableWidget#modernTable::item:alternate {
-                background: rgba(30, 41, 59, 0.5);
-            }
-            
-            QTableWidget#modernTable::item:selected {
-                background: rgba(59, 130, 246, 0.4);
-                color: white;
-            }
-            
-            QHeaderView::section {
-                background: rgba(30, 41, 59, 0.9);
-                color: #ffffff;
-                padding: 12px;
-                border: none;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            
-            QPushButton#infoButton {
-                background: rgba(59, 130, 246, 0.3);
-                color: white;
-                border: 2px solid rgba(59, 130, 246, 0.5);
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            
-            QPushButton#infoButton:hover {
-                background: rgba(59, 130, 246, 0.5);
-                border-color: rgba(59, 130, 246, 0.8);
-            }
-            
-            QPushButton#modernButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #3b82f6, stop:1 #2563eb);
-                color: white;
-                border: none;
-                border-radius: 10px;
-                padding: 12px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            
-            QPushButton#modernButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #2563eb, stop:1 #1d4ed8);
-            }
-            
-            QPushButton#modernButton:pressed {
-                background: #1e40af;
-            }
-            
-            QPushButton#dangerButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(239, 68, 68, 0.6), stop:1 rgba(220, 38, 38, 0.6));
-                color: white;
-                border: 2px solid rgba(239, 68, 68, 0.5);
-                border-radius: 10px;
-                padding: 12px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            
-            QPushButton#dangerButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #ef4444, stop:1 #dc2626);
-                border-color: #ef4444;
-            }
-            
-            QPushButton#dangerButton:pressed {
-                background: #991b1b;
-            }
-            
-            QScrollBar:vertical {
-                background: transparent;
-                width: 0px;
-                border-radius: 0px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background: transparent;
-                border-radius: 0px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background: transparent;
-            }
-        """)
+        self.setStyleSheet(_MODERN_STYLESHEET)
     
     def mousePressEvent(self, event):
         """Handle mouse press for dragging"""
@@ -1331,38 +1639,14 @@ class ModernStopwatchWidget(QMainWindow):
             self.showMaximized()
             self.max_button.setText("❐")
     
-    def resizeEvent(self, event):
-        """Handle window resize - make chart responsive"""
-        super().resizeEvent(event)
-        # Refresh chart when window is resized to adjust canvas size
-        if hasattr(self, 'figure') and hasattr(self, 'canvas'):
-            # Update figure size based on window size
-            width = self.width() - 80  # Account for margins
-            height = max(400, self.height() - 200)  # Minimum 400px height
-            
-            # Convert pixels to inches (matplotlib uses inches)
-            dpi = self.figure.get_dpi()
-            self.figure.set_size_inches(width / dpi, height / dpi)
-            
-            # Redraw canvas
-            if self.canvas:
-                self.canvas.draw_idle()
-    
     def init_timer(self):
         """Initialize timer to update UI"""
+        # One 1s timer drives the display and, every 60th tick, the midnight
+        # rollover check and the auto-save, so the app wakes once a second
+        self._tick = 0
         self.timer = QTimer()
-        self.timer.timeout.connect(self.update_display)
+        self.timer.timeout.connect(self.on_timer_tick)
         self.timer.start(1000)  # Update every second
-        
-        # Auto-save timer - saves to database every minute
-        self.autosave_timer = QTimer()
-        self.autosave_timer.timeout.connect(self.auto_save_to_db)
-        self.autosave_timer.start(60000)  # Save every 60 seconds (1 minute)
-        
-        # Date check timer - checks for midnight rollover every minute
-        self.date_check_timer = QTimer()
-        self.date_check_timer.timeout.connect(self.check_date_change)
-        self.date_check_timer.start(60000)  # Check every minute
     
     def check_date_change(self):
         """Check if date has changed (midnight rollover) and reset daily counters"""
@@ -1372,9 +1656,10 @@ class ModernStopwatchWidget(QMainWindow):
             
             # Close current session if active
             if self.session_id is not None:
-                self.db.end_session(self.session_id)
+                self.db.finalize_session(self.session_id, self._final_session_seconds())
                 self.session_id = None
-                self.session_start_time = None
+                self._session_elapsed.invalidate()
+                self._session_start_wall = None
             
             # Reset daily counters
             self.work_seconds = 0
@@ -1387,8 +1672,10 @@ class ModernStopwatchWidget(QMainWindow):
             
             # Refresh UI
             self.update_display()
-            self.refresh_history()
-            self.refresh_charts()
+            if hasattr(self, 'history_table'):
+                self.refresh_history()
+            if hasattr(self, 'figure'):
+                self.refresh_charts()
             
             print(f"[DATE CHANGE] Counters reset for new day: {new_date}")
     
@@ -1407,77 +1694,101 @@ class ModernStopwatchWidget(QMainWindow):
     
     def on_idle_checkbox_changed(self, state):
         """Handle leisure checkbox state change"""
-        # Close current session if active
-        if self.session_id is not None:
-            # Save the current session time
-            current_session_seconds = (datetime.now() - self.session_start_time).total_seconds()
-            self.db.update_session(self.session_id, int(current_session_seconds), self.is_working)
-            self.db.end_session(self.session_id)
+        # Closing the old session and opening the new one share one commit
+        with self.db.transaction():
+            # Close current session if active
+            if self.session_id is not None:
+                # Save the current session time
+                elapsed = self._session_seconds()
+                self.db.finalize_session(self.session_id, elapsed)
+                
+                # Update the counters with completed session
+                if self.is_working:
+                    self.work_seconds += elapsed
+                else:
+                    self.idle_seconds += elapsed
+                
+                # Reset session
+                self.session_id = None
+                self._session_elapsed.invalidate()
+                self._session_start_wall = None
             
-            # Update the counters with completed session
-            if self.is_working:
-                self.work_seconds += int(current_session_seconds)
-            else:
-                self.idle_seconds += int(current_session_seconds)
+            # Switch mode
+            self.is_working = not self.idle_checkbox.isChecked()
             
-            # Reset session
-            self.session_id = None
-            self.session_start_time = None
-        
-        # Switch mode
-        self.is_working = not self.idle_checkbox.isChecked()
-        
-        # If user is still active, start new session with new mode
-        if self.tracker.is_user_active():
-            self.session_id = self.db.start_session(self.is_working)
-            self.session_start_time = datetime.now()
+            # If user is still active, start new session with new mode
+            if self.tracker.is_user_active():
+                self.start_new_session()
     
     def auto_save_to_db(self):
         """Auto-save current session to database every minute"""
         if self.session_id is not None and self.tracker.is_user_active():
-            current_session_seconds = (datetime.now() - self.session_start_time).total_seconds()
-            self.db.update_session(self.session_id, int(current_session_seconds), self.is_working)
-            # Log for debugging
-            print(f"[Auto-save] Session {self.session_id} saved: {int(current_session_seconds)} seconds")
+            self.db_writer.update_session_requested.emit(self.session_id, self._session_seconds())
+    
+    def start_new_session(self):
+        """Open a session in the current mode and start its clock"""
+        self.session_id = self.db.start_session(self.is_working)
+        self._session_elapsed.start()
+        self._session_start_wall = time.time()
+    
+    def _session_seconds(self):
+        """Whole seconds since the current session started (monotonic clock)"""
+        return self._session_elapsed.elapsed() // 1000
+    
+    def _final_session_seconds(self):
+        """Duration to close the current session with
+        
+        While the user is active that is the session clock. Once idle, the
+        session ended at the tracker's last activity, which (like
+        _session_start_wall) is wall-clock time; auto-save only ran while
+        active, so the stored duration may be up to a minute behind.
+        """
+        if self.tracker.is_user_active() or self._session_start_wall is None:
+            return self._session_seconds()
+        return max(0, int(self.tracker.last_activity - self._session_start_wall))
+    
+    def on_timer_tick(self):
+        """Refresh the display every second; check the date and auto-save once a minute"""
+        self.update_display()
+        self._tick = (self._tick + 1) % 60
+        if self._tick == 0:
+            # Date first, so a session closed at midnight is not auto-saved
+            self.check_date_change()
+            self.auto_save_to_db()
     
     def update_display(self):
         """Update the timer displays"""
+        # Hidden to the tray or minimized: keep opening sessions but skip all
+        # display work (showEvent/changeEvent refresh the labels when the
+        # window comes back)
+        if not self.isVisible() or self.isMinimized():
+            if self.session_id is None and self.tracker.is_user_active():
+                self.start_new_session()
+            return
+        
         # Check if user is active
         if self.tracker.is_user_active():
             # Create new session if needed
             if self.session_id is None:
-                self.session_id = self.db.start_session(self.is_working)
-                self.session_start_time = datetime.now()
+                self.start_new_session()
             
-            # Calculate current session time from session start
-            if self.session_start_time:
-                current_session_seconds = (datetime.now() - self.session_start_time).total_seconds()
-            else:
-                current_session_seconds = 0
-            
-            # Ensure we don't get negative time
-            if current_session_seconds < 0:
-                current_session_seconds = 0
+            # Whole seconds in the current session
+            elapsed = self._session_seconds()
             
-            # Update database
-            self.db.update_session(self.session_id, int(current_session_seconds), self.is_working)
+            # Only the display is updated here; auto_save_to_db persists the
+            # running session and the final duration is written when it ends
             
             # Update counters
             if self.is_working:
-                display_work = self.work_seconds + int(current_session_seconds)
+                display_work = self.work_seconds + elapsed
                 display_idle = self.idle_seconds
             else:
                 display_work = self.work_seconds
-                display_idle = self.idle_seconds + int(current_session_seconds)
+                display_idle = self.idle_seconds + elapsed
             
             mode = "Work" if self.is_working else "Leisure"
-            self.status_label.setText(f"🟢 Active - {mode} Mode")
-            self.status_label.setStyleSheet("""
-                color: white;
-                padding: 10px;
-                background: rgba(16, 185, 129, 0.2);
-                border-radius: 10px;
-            """)
+            self._set_label_text(self.status_label, f"🟢 Active - {mode} Mode")
+            self._set_status_active(True)
         else:
             # User is idle - DO NOT ACCUMULATE TIME
             # DON'T close session here - only close when a pause is actually logged
@@ -1486,136 +1797,88 @@ class ModernStopwatchWidget(QMainWindow):
             # During inactivity, display accumulated time only (no counting)
             display_work = self.work_seconds
             display_idle = self.idle_seconds
-            self.status_label.setText("⚫ Inactive")
-            self.status_label.setStyleSheet("""
-                color: rgba(255, 255, 255, 0.7);
-                padding: 10px;
-                background: rgba(255, 255, 255, 0.05);
-                border-radius: 10px;
-            """)
+            self._set_label_text(self.status_label, "⚫ Inactive")
+            self._set_status_active(False)
         
         # Get session counts
         work_sessions, leisure_sessions = self.db.get_today_session_counts()
         total_sessions = work_sessions + leisure_sessions
         
         # Update displays - always show pause time and count
-        self.work_time_display.setText(self.format_seconds(display_work))
-        self.work_session_display.setText(f"{work_sessions} session{'s' if work_sessions != 1 else ''}")
+        fmt = self.format_seconds
+        count = self.format_count
+        set_text = self._set_label_text
+        set_text(self.work_time_display, fmt(display_work))
+        set_text(self.work_session_display, count(work_sessions, "session"))
         
-        self.idle_time_display.setText(self.format_seconds(display_idle))
-        self.leisure_session_display.setText(f"{leisure_sessions} session{'s' if leisure_sessions != 1 else ''}")
+        set_text(self.idle_time_display, fmt(display_idle))
+        set_text(self.leisure_session_display, count(leisure_sessions, "session"))
         
-        self.pause_time_display.setText(self.format_seconds(self.pause_seconds))
-        self.pause_count_display.setText(f"{self.pause_count} pause{'s' if self.pause_count != 1 else ''}")
+        set_text(self.pause_time_display, fmt(self.pause_seconds))
+        set_text(self.pause_count_display, count(self.pause_count, "pause"))
         
-        self.total_time_display.setText(self.format_seconds(display_work + display_idle + self.pause_seconds))
-        self.total_session_display.setText(f"{total_sessions} session{'s' if total_sessions != 1 else ''}")
+        set_text(self.total_time_display, fmt(display_work + display_idle + self.pause_seconds))
+        set_text(self.total_session_display, count(total_sessions, "session"))
+    
+    def _set_label_text(self, label, text):
+        """Set a label's text only if it differs from the last value set"""
+        if self._label_text.get(label) != text:
+            self._label_text[label] = text
+            label.setText(text)
+    
+    def _set_status_active(self, active):
+        """Restyle the status label through its objectName when the state flips"""
+        if self._status_active is active:
+            return
+        self._status_active = active
+        label = self.status_label
+        label.setObjectName("statusLabelActive" if active else "statusLabelIdle")
+        label.style().unpolish(label)
+        label.style().polish(label)
+    
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def format_seconds(seconds):
+        """Format seconds as HH:MM:SS (memoized; display ticks repeat values)"""
+        hours, rem = divmod(int(seconds), 3600)
+        minutes, secs = divmod(rem, 60)
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
     
-    def format_seconds(self, seconds):
-        """Format seconds as HH:MM:SS"""
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
-        return f"{int(hours):02d}:{int(minutes):02d}:{int(secs):02d}"
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def format_count(count, noun):
+        """Format a count with its noun, pluralized (memoized like format_seconds)"""
+        return f"{count} {noun}{'s' if count != 1 else ''}"
     
     def refresh_history(self):
         """Refresh history table - show all individual sessions"""
         # Get all activity sessions (work and leisure)
         sessions = self.db.get_all_sessions(days=365)  # Get last year of data
         
-        self.history_table.setRowCount(len(sessions))
-        
-        for i, (date, start_time, end_time, duration, session_type) in enumerate(sessions):
-            self.history_table.setItem(i, 0, QTableWidgetItem(date))
-            self.history_table.setItem(i, 1, QTableWidgetItem(start_time))
-            self.history_table.setItem(i, 2, QTableWidgetItem(end_time))
-            self.history_table.setItem(i, 3, QTableWidgetItem(self.format_seconds(duration)))
-            
-            # Add colored type indicator
-            type_item = QTableWidgetItem(session_type)
-            if session_type == "Work":
-                type_item.setForeground(QColor("#10b981"))  # Green
-            else:
-                type_item.setForeground(QColor("#f59e0b"))  # Orange
-            self.history_table.setItem(i, 4, type_item)
-        
-        # Refresh pauses table with detailed times
-        pauses = self.db.get_all_pauses_detailed(days=365)
-        self.pauses_table.setRowCount(len(pauses))
-        
-        for i, (date, pause_start, pause_end, duration) in enumerate(pauses):
-            self.pauses_table.setItem(i, 0, QTableWidgetItem(date))
-            self.pauses_table.setItem(i, 1, QTableWidgetItem(pause_start))
-            self.pauses_table.setItem(i, 2, QTableWidgetItem(pause_end))
-            
-            # Add colored duration
-            duration_item = QTableWidgetItem(self.format_seconds(duration))
-            duration_item.setForeground(QColor("#a855f7"))  # Purple
-            self.pauses_table.setItem(i, 3, duration_item)
+        # Each model reset is a single view update; cells are formatted
+        # only when the view asks for the visible rows
+        self.history_model.set_rows(sessions)
+        # Pauses are read from the database a page at a time as the
+        # table is scrolled
+        self.pauses_model.set_pager(
+            lambda offset, limit: self.db.get_all_pauses_detailed(days=365, offset=offset, limit=limit))
     
     def show_info_dialog(self):
         """Show information dialog about how the tracker works"""
-        msg = QMessageBox(self)
-        msg.setWindowTitle("How Activity Tracker Works")
-        msg.setIcon(QMessageBox.Information)
-        
-        info_text = """
-<h3 style='color: #3b82f6;'>⏱️ How Activity Tracking Works</h3>
-
-<p><b style='color: #10b981;'>Automatic Timer Start:</b><br>
-• The timer starts automatically when you move your mouse or press any key<br>
-• It detects your activity in real-time</p>
-
-<p><b style='color: #f59e0b;'>Automatic Timer Stop:</b><br>
-• The timer stops automatically after <b>60 seconds of inactivity</b><br>
-• Inactivity = no mouse movement, clicks, or keyboard input</p>
-
-<p><b style='color: #3b82f6;'>Work Mode vs Leisure Mode:</b><br>
-• <b>Work Mode (default):</b> Time is counted as productive work<br>
-• <b>Leisure Mode:</b> Check the box to track break/leisure time<br>
-• Switch modes anytime - times are kept separate</p>
-
-<p><b style='color: #8b5cf6;'>Data Persistence:</b><br>
-• Your activity is automatically saved every 60 seconds<br>
-• Data is stored in a local database<br>
-• View your history and charts anytime</p>
-        """
-        
-        msg.setText(info_text)
-        
-        # Apply modern style to message box
-        msg.setStyleSheet("""
-            QMessageBox {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #1e293b, stop:1 #0f172a);
-                border-radius: 15px;
-            }
-            QMessageBox QLabel {
-                color: white;
-                min-width: 450px;
-                background: transparent;
-            }
-            QMessageBox QWidget {
-                background: transparent;
-            }
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #3b82f6, stop:1 #2563eb);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 25px;
-                font-weight: bold;
-                min-width: 100px;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #2563eb, stop:1 #1d4ed8);
-            }
-        """)
+        # Built on first use and reused, so the HTML and stylesheet are
+        # only parsed once
+        if self._info_msgbox is None:
+            msg = QMessageBox(self)
+            msg.setWindowTitle("How Activity Tracker Works")
+            msg.setIcon(QMessageBox.Information)
+            
+            msg.setText(_INFO_HTML)
+            
+            # Apply modern style to message box
+            msg.setStyleSheet(_INFO_MSG_STYLESHEET)
+            self._info_msgbox = msg
         
-        msg.exec_()
+        self._info_msgbox.exec_()
     
     
     def on_pause_detected(self, pause_duration, pause_start_timestamp, work_end_timestamp):
@@ -1638,17 +1901,18 @@ class ModernStopwatchWidget(QMainWindow):
                 print(f"[MAIN THREAD] Ending work session {self.session_id} at {work_end_timestamp}")
                 
                 # Calculate session duration up to work_end_timestamp
-                if self.session_start_time:
-                    work_end_datetime = datetime.fromtimestamp(work_end_timestamp)
-                    session_duration = (work_end_datetime - self.session_start_time).total_seconds()
+                final_duration = None
+                if self._session_start_wall is not None:
+                    # Both ends on the wall clock: from session start to when
+                    # work actually ended (before any suspend)
+                    session_duration = work_end_timestamp - self._session_start_wall
                     
                     if session_duration > 0:
                         print(f"[MAIN THREAD] Session duration: {session_duration:.1f}s")
-                        # Update the session with final duration
-                        self.db.update_session(self.session_id, int(session_duration), self.is_working)
+                        final_duration = int(session_duration)
                 
-                # End the session
-                self.db.end_session(self.session_id)
+                # End the session with its final duration in one write
+                self.db.finalize_session(self.session_id, final_duration)
                 
                 # Reload today's stats
                 work, idle = self.db.get_today_stats()
@@ -1657,13 +1921,14 @@ class ModernStopwatchWidget(QMainWindow):
                 
                 # Clear session
                 self.session_id = None
-                self.session_start_time = None
+                self._session_elapsed.invalidate()
+                self._session_start_wall = None
                 
                 print(f"[MAIN THREAD] ✅ Work session ended. Total work today: {self.work_seconds}s")
             
             # Then log the pause with actual start timestamp
             self.db.log_pause(int(pause_duration), pause_start_timestamp)
-            print(f"[MAIN THREAD] ✅ Pause logged to database successfully")
+            print("[MAIN THREAD] ✅ Pause logged to database successfully")
             
             # Update pause counters in memory
             self.pause_seconds += int(pause_duration)
@@ -1686,89 +1951,178 @@ class ModernStopwatchWidget(QMainWindow):
     
     def refresh_charts(self):
         """Refresh charts with work, leisure, and pause data"""
-        stats = self.db.get_daily_stats(30)  # Last 30 days for better history view
-        pauses = self.db.get_pause_periods(days=30)  # Get pauses for 30 days
+        # A hidden chart is not redrawn; it is refreshed when next shown
+        if not self.canvas.isVisible():
+            self._charts_dirty = True
+            return
+        
+        # Calls closer together than CHART_MIN_INTERVAL collapse into a single
+        # deferred refresh
+        now = time.monotonic()
+        wait = self._last_chart_refresh + self.CHART_MIN_INTERVAL - now
+        if wait > 0:
+            if not self._chart_refresh_pending:
+                self._chart_refresh_pending = True
+                QTimer.singleShot(int(wait * 1000) + 1, self._run_pending_chart_refresh)
+            return
+        self._last_chart_refresh = now
+        
+        # Last 30 days for better history view; today includes the running
+        # session's time since its last auto-save
+        live_session = None
+        if self.session_id is not None and self.tracker.is_user_active():
+            live_session = (self.session_id, self._session_seconds())
+        stats = self.db.get_daily_stats(30, live_session)
         
         if not stats:
             return
         
-        # Prepare daily stats
-        dates = [s[0] for s in reversed(stats)]
-        work_hours = [s[1] / 3600 for s in reversed(stats)]  # Convert to hours
-        leisure_hours = [s[2] / 3600 for s in reversed(stats)]
+        # Pause (date, count, seconds) per day, summed by the database
+        pause_totals = self.db.get_daily_pause_totals(days=30)
         
-        # Count pauses per day
-        pause_count_by_date = {}
-        total_pause_duration_by_date = {}
+        # Daily bars are unreadable in a narrow chart: show weekly totals
+        weekly = self.canvas.width() < self.CHART_WEEKLY_WIDTH and len(stats) > 7
         
-        for date, pause_time, duration in pauses:
-            if date not in pause_count_by_date:
-                pause_count_by_date[date] = 0
-                total_pause_duration_by_date[date] = 0
-            pause_count_by_date[date] += 1
-            total_pause_duration_by_date[date] += duration
+        # Nothing to redraw if the chart already shows exactly this data
+        chart_key = (stats, pause_totals, weekly)
+        if chart_key == getattr(self, '_chart_key', None):
+            return
+        self._chart_key = chart_key
         
-        # Convert pause durations to hours and align with dates
-        pause_hours = [total_pause_duration_by_date.get(d, 0) / 3600 for d in dates]
+        # Prepare daily stats, oldest first; hours as float64 arrays
+        stats = stats[::-1]
+        dates = [s[0] for s in stats]
+        day_hours = np.array([s[1:] for s in stats], dtype=np.float64) * (1.0 / 3600.0)
+        work_hours = day_hours[:, 0]
+        leisure_hours = day_hours[:, 1]
         
-        # Clear figure
-        self.figure.clear()
+        # Pause seconds per day
+        total_pause_duration_by_date = {d: secs for d, count, secs in pause_totals}
         
-        # Determine figure height based on number of days (for scrolling)
+        # Convert pause durations to hours and align with dates
+        pause_hours = np.array([total_pause_duration_by_date.get(d, 0) for d in dates],
+                               dtype=np.float64) * (1.0 / 3600.0)
+        if weekly:
+            dates, work_hours, leisure_hours, pause_hours = _weekly_totals(
+                dates, work_hours, leisure_hours, pause_hours)
         num_days = len(dates)
-        fig_height = max(4, 3 + (num_days * 0.15))  # Scale height with number of days
-        self.figure.set_figheight(fig_height)
+        max_value = max(work_hours.max(), leisure_hours.max(), pause_hours.max())
+        
+        # Data read by the hover tooltips
+        previous_dates = getattr(self, '_chart_data', ((),))[0]
+        self._chart_data = (dates, work_hours, leisure_hours, pause_hours)
+        
+        # Same number of days as the bars already drawn: reuse the artists
+        # and only move bar heights, date labels and the y-range
+        chart_bars = self._chart_bars
+        if chart_bars is not None and len(chart_bars[0]) == num_days and weekly == self._chart_weekly:
+            for bars, hours in zip(chart_bars, (work_hours, leisure_hours, pause_hours)):
+                for bar, hour in zip(bars, hours):
+                    bar.set_height(hour)
+            
+            ax = self._chart_ax
+            y_top = max_value * 1.1 if max_value > 0 else ax.get_ylim()[1]
+            if (dates == previous_dates and y_top == ax.get_ylim()[1]
+                    and self._chart_bg is not None and not self.chart_annotation.get_visible()):
+                # Only the bar heights changed: blit the bars over the
+                # background saved by the last full draw. Everything that
+                # moved is inside the axes, so only that area is repainted
+                self.blit_chart(ax.bbox)
+                return
+            
+            self.set_chart_date_labels(ax, dates)
+            ax.set_ylim(0, y_top)
+            self.chart_annotation.set_visible(False)
+            self.canvas.draw_idle()
+            return
         
-        # Create subplot with dark theme
-        ax = self.figure.add_subplot(111, facecolor='#1e293b')
+        # New number of days: swap in fresh bar containers on the styled axes
+        ax = self._chart_ax
+        if chart_bars is not None:
+            for bars in chart_bars:
+                bars.remove()
+        
+        # Determine figure height based on number of days (for scrolling).
+        # The canvas is grown instead of the figure: the canvas keeps the
+        # figure at exactly its widget size, so Agg never rasterizes
+        # pixels that are not shown
+        fig_height = max(4, 3 + (num_days * 0.15))  # Scale height with number of days
+        self.canvas.setMinimumHeight(max(600, int(fig_height * self.figure.dpi)))
         
         # Bar positions and width (side-by-side bars)
-        x = range(num_days)
-        width = 0.26  # Slightly narrower for many bars
-        
-        # Create side-by-side bars: work, leisure, pauses
-        bars1 = ax.bar([i - width for i in x], work_hours, width, 
-                       label='Work', color='#10b981', alpha=0.85)
-        bars2 = ax.bar([i for i in x], leisure_hours, width,
-                       label='Leisure', color='#f59e0b', alpha=0.85)
-        bars3 = ax.bar([i + width for i in x], pause_hours, width, 
-                       label='Pauses', color='#8b5cf6', alpha=0.85)
-        
-        # Labels and title
-        ax.set_xlabel('Date', color='white', fontweight='bold', fontsize=11)
-        ax.set_ylabel('Hours', color='white', fontweight='bold', fontsize=11)
+        x, x_left, x_right = _bar_positions(num_days, _BAR_WIDTH)
+        width = _BAR_WIDTH
+        
+        # Create side-by-side bars: work, leisure, pauses. They are animated
+        # artists, drawn by on_chart_draw on top of the saved background
+        bars1 = ax.bar(x_left, work_hours, width, 
+                       label='Work', color='#10b981', alpha=0.85, animated=True)
+        bars2 = ax.bar(x, leisure_hours, width,
+                       label='Leisure', color='#f59e0b', alpha=0.85, animated=True)
+        bars3 = ax.bar(x_right, pause_hours, width, 
+                       label='Pauses', color='#8b5cf6', alpha=0.85, animated=True)
         
         # Dynamic title based on number of days
-        if num_days <= 7:
-            title = f'Activity Overview - Last {num_days} Days'
-        elif num_days <= 30:
-            title = f'Activity Overview - Last {num_days} Days'
+        if len(stats) <= 7:
+            title = f'Activity Overview - Last {len(stats)} Days'
+        elif len(stats) <= 30:
+            title = f'Activity Overview - Last {len(stats)} Days'
         else:
             title = 'Activity Overview'
+        if weekly:
+            title += ' (weekly)'
         
         ax.set_title(title, color='white', fontweight='bold', pad=15, fontsize=12)
         
         # X-axis configuration for better readability with many dates
         ax.set_xticks(x)
-        if num_days > 14:
-            # Show every other date if more than 14 days
-            ax.set_xticklabels([dates[i] if i % 2 == 0 else '' for i in range(num_days)], 
-                               rotation=45, ha='right', color='white', fontsize=9)
-        else:
-            ax.set_xticklabels(dates, rotation=45, ha='right', color='white', fontsize=10)
+        self.set_chart_date_labels(ax, dates)
         
-        ax.tick_params(colors='white', labelsize=9)
+        # Fit the axes to the new bars (removed bars leave stale data limits)
+        ax.set_autoscale_on(True)
+        ax.relim()
+        ax.autoscale_view()
         
         # Set Y-axis with smart scaling
-        max_value = max(max(work_hours + [0]), max(leisure_hours + [0]), max(pause_hours + [0]))
         if max_value > 0:
             ax.set_ylim(0, max_value * 1.1)  # 10% padding at top
         
-        # Legend
-        legend = ax.legend(facecolor='#0f172a', edgecolor='white', framealpha=0.9, 
+        # Only the bottom margin depends on the data (room for the date labels)
+        self.figure.subplots_adjust(bottom=0.25 if num_days > 10 else 0.2)
+        
+        # Keep the artists so later refreshes can update them in place
+        self._chart_bars = (bars1, bars2, bars3)
+        self._chart_weekly = weekly
+        self._chart_bg = None
+        self.chart_annotation.set_visible(False)
+        
+        # Update canvas (coalesced with any other pending repaint)
+        self.canvas.draw_idle()
+    
+    def build_chart_scaffold(self):
+        """Create the overview chart's axes and all of its static styling once
+        
+        refresh_charts only adds the bars, the title, the date labels and
+        the y-range on top of this.
+        """
+        # Create subplot with dark theme
+        ax = self.figure.add_subplot(111, facecolor=_DARK_BG)
+        
+        # Labels
+        ax.set_xlabel('Date', color='white', fontweight='bold', fontsize=11)
+        ax.set_ylabel('Hours', color='white', fontweight='bold', fontsize=11)
+        ax.tick_params(colors='white', labelsize=9)
+        
+        # Legend from proxy patches, so it survives bars being replaced
+        handles = [Patch(color=color, alpha=0.85, label=label)
+                   for label, color in (('Work', '#10b981'), ('Leisure', '#f59e0b'), ('Pauses', '#8b5cf6'))]
+        legend = ax.legend(handles=handles, facecolor='#0f172a', edgecolor='white', framealpha=0.9, 
                           loc='upper left', fontsize=10)
         for text in legend.get_texts():
             text.set_color('white')
+        # Drawn after the animated bars so it stays on top of them
+        legend.set_animated(True)
+        self._chart_legend = legend
         
         # Grid
         ax.grid(True, alpha=0.15, color='white', axis='y', linestyle='--')
@@ -1779,52 +2133,101 @@ class ModernStopwatchWidget(QMainWindow):
         ax.spines['left'].set_linewidth(0.5)
         ax.spines['bottom'].set_linewidth(0.5)
         
-        # Better margins for many dates
-        left_margin = 0.12
-        right_margin = 0.95
-        top_margin = 0.93
-        bottom_margin = 0.25 if num_days > 10 else 0.2
+        # Fixed margins, set once instead of measuring the artists per refresh
+        self.figure.subplots_adjust(left=0.12, right=0.95, top=0.93)
         
-        self.figure.subplots_adjust(left=left_margin, right=right_margin, 
-                                    top=top_margin, bottom=bottom_margin)
+        self._chart_ax = ax
+        self._chart_bars = None
+        self._chart_weekly = False
+        self._chart_bg = None
+        self.canvas.mpl_connect('draw_event', self.on_chart_draw)
+        self.canvas.mpl_connect('resize_event', self.on_chart_resize)
         
         # Add interactive tooltips
-        self.add_bar_tooltips(ax, bars1, bars2, bars3, dates, work_hours, leisure_hours, pause_hours)
-        
-        # Update canvas
-        self.canvas.draw()
+        self.add_bar_tooltips(ax)
+    
+    def _refresh_dirty_charts(self):
+        """Run the chart refresh that was skipped while the chart was hidden"""
+        if self._charts_dirty and self.canvas.isVisible():
+            self._charts_dirty = False
+            self.refresh_charts()
+    
+    def _run_pending_chart_refresh(self):
+        """Run the refresh deferred by refresh_charts' rate limit"""
+        self._chart_refresh_pending = False
+        self.refresh_charts()
+    
+    def on_chart_resize(self, event):
+        """Switch between daily and weekly bars when the width crosses the limit"""
+        if self._chart_bars is not None:
+            weekly = self.canvas.width() < self.CHART_WEEKLY_WIDTH and len(self._chart_key[0]) > 7
+            if weekly != self._chart_weekly:
+                self.refresh_charts()
+    
+    def on_chart_draw(self, event):
+        """After each full draw, save the background and draw the bars on it"""
+        self._chart_bg = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.draw_chart_bars()
     
-    def add_bar_tooltips(self, ax, bars1, bars2, bars3, dates, work_hours, leisure_hours, pause_hours):
+    def blit_chart(self, bbox=None):
+        """Repaint the animated artists over the saved background, without a full draw"""
+        if self._chart_bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._chart_bg)
+        self.draw_chart_bars()
+        self.canvas.blit(bbox if bbox is not None else self.figure.bbox)
+    
+    def draw_chart_bars(self):
+        """Draw the animated artists of the overview chart: bars, then overlays"""
+        ax = self._chart_ax
+        if self._chart_bars is not None:
+            for bars in self._chart_bars:
+                for bar in bars:
+                    ax.draw_artist(bar)
+        ax.draw_artist(self._chart_legend)
+        ax.draw_artist(self.chart_annotation)
+    
+    def set_chart_date_labels(self, ax, dates):
+        """Set the date tick labels of the overview chart"""
+        if len(dates) > 14:
+            # Show every other date if more than 14 days
+            ax.set_xticklabels([d if i % 2 == 0 else '' for i, d in enumerate(dates)], 
+                               rotation=45, ha='right', color='white', fontsize=9)
+        else:
+            ax.set_xticklabels(dates, rotation=45, ha='right', color='white', fontsize=10)
+    
+    def add_bar_tooltips(self, ax):
         """Add interactive tooltips to bar chart"""
         # Create annotation object (initially invisible)
         self.chart_annotation = ax.annotate(
             '', xy=(0, 0), xytext=(15, 15),
             textcoords='offset points',
-            bbox=dict(boxstyle='round,pad=0.8', facecolor='#1e293b', edgecolor='white', alpha=0.95),
+            bbox=dict(boxstyle='round,pad=0.8', facecolor=_DARK_BG, edgecolor='white', alpha=0.95),
             arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0', color='white'),
             color='white',
             fontsize=10,
             fontweight='bold',
             visible=False,
-            zorder=1000
+            zorder=1000,
+            animated=True  # Drawn above the animated bars by draw_chart_bars
         )
         
-        def format_time(hours):
-            """Convert hours to HH:MM:SS format"""
-            total_seconds = int(hours * 3600)
-            h = total_seconds // 3600
-            m = (total_seconds % 3600) // 60
-            s = total_seconds % 60
-            return f"{h:02d}:{m:02d}:{s:02d}"
-        
         def on_hover(event):
             """Handle mouse hover events"""
+            annotation = self.chart_annotation
             if event.inaxes != ax:
-                self.chart_annotation.set_visible(False)
-                self.canvas.draw_idle()
+                if annotation.get_visible():
+                    annotation.set_visible(False)
+                    self.blit_chart()
                 return
             
             # Check if mouse is over any bar
+            if self._chart_bars is None:
+                return
+            shown = (annotation.get_visible(), annotation.get_text())
+            bars1, bars2, bars3 = self._chart_bars
+            dates, work_hours, leisure_hours, pause_hours = self._chart_data
             found = False
             for bars, hours, label, color in [
                 (bars1, work_hours, 'Work', '#10b981'),
@@ -1838,7 +2241,7 @@ class ModernStopwatchWidget(QMainWindow):
                         y = bar.get_height()
                         
                         # Format tooltip text
-                        time_str = format_time(hour)
+                        time_str = self.format_seconds(round(hour * 3600))
                         text = f"{dates[i]}\n{label}: {time_str}\n({hour:.2f}h)"
                         
                         # Update annotation
@@ -1856,29 +2259,44 @@ class ModernStopwatchWidget(QMainWindow):
             if not found:
                 self.chart_annotation.set_visible(False)
             
-            self.canvas.draw_idle()
+            # Repaint only when the tooltip changed
+            if (annotation.get_visible(), annotation.get_text()) != shown:
+                self.blit_chart()
         
         # Connect hover event
         self.canvas.mpl_connect('motion_notify_event', on_hover)
     
     def closeEvent(self, event):
         """Handle application close"""
+        # Nothing may touch the database once it is closed below: stop the
+        # tick and take the analytics window down with this one
+        self.timer.stop()
+        if self.analytics_window is not None:
+            self.analytics_window.close()
+            self.analytics_window = None
+        
+        # Let queued background writes finish before the final ones
+        self.db_writer.stop_requested.emit()
+        self.db_thread.wait()
+        
         if self.session_id:
-            self.db.end_session(self.session_id)
+            self.db.finalize_session(self.session_id, self._final_session_seconds())
         self.tracker.stop()
+        self.db.close()
         self.tray_icon.hide()
         event.accept()
 
 
 def main():
     # Set Windows taskbar icon (MUST be before QApplication!)
-    try:
-        import ctypes
-        # Use simple, universal AppUserModelID
-        myappid = 'ActivityTracker'
-        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
-    except Exception as e:
-        print(f"Warning: Could not set app model ID: {e}")
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+            # Use simple, universal AppUserModelID
+            myappid = 'ActivityTracker'
+            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(myappid)
+        except Exception as e:
+            print(f"Warning: Could not set app model ID: {e}")
     
     # Create app with minimal overhead
     app = QApplication(sys.argv)
@@ -1894,13 +2312,12 @@ def main():
     
     # Set dark palette
     palette = QPalette()
-    palette.setColor(QPalette.Window, QColor(30, 41, 59))
+    palette.setColor(QPalette.Window, QColor(_DARK_BG))
     palette.setColor(QPalette.WindowText, Qt.white)
     app.setPalette(palette)
     
     # Create and show window
     window = ModernStopwatchWidget()
-    window.setWindowIcon(app_icon)
     window.show()
     sys.exit(app.exec_())
 
@@ -1,5 +1,4 @@
 import time
-from datetime import datetime
 from pynput import mouse, keyboard
 from threading import Thread, Lock
 import logging